@@ -4,6 +4,7 @@ from __future__ import annotations
 import subprocess
 import webbrowser
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 
 
@@ -27,6 +28,7 @@ from hawaiidisco.bookmark import save_bookmark_md, delete_bookmark_md
 from hawaiidisco.obsidian import save_obsidian_note, save_digest_note, delete_obsidian_note, validate_vault_path
 from hawaiidisco.digest import get_or_generate_digest
 from hawaiidisco.translate import translate_article_meta, translate_text
+from hawaiidisco.screens.bookmark import _memo_preview
 from hawaiidisco.screens.digest import DigestScreen
 from hawaiidisco.widgets.timeline import Timeline
 from hawaiidisco.widgets.detail import DetailView
@@ -398,8 +400,9 @@ class FeedItem(ListItem):
         self._count = count
 
     def compose(self) -> ComposeResult:
-        yield Static(self._format())
+        yield Static(self._format)
 
+    @cached_property
     def _format(self) -> str:
         return (
             f"[bold cyan]{_escape(self.feed.name)}[/]\n"
@@ -523,15 +526,16 @@ class BookmarkItem(ListItem):
         self._tags = tags or []
 
     def compose(self) -> ComposeResult:
-        yield Static(self._format())
+        yield Static(self._format)
 
+    @cached_property
     def _format(self) -> str:
         a = self.article
         date_str = ""
         if a.published_at:
-            date_str = a.published_at.strftime("%Y-%m-%d")
+            date_str = a.published_at.date().isoformat()
         elif a.fetched_at:
-            date_str = a.fetched_at.strftime("%Y-%m-%d")
+            date_str = a.fetched_at.date().isoformat()
 
         line1 = f"[bold yellow]★[/] [bold]{_escape(a.title)}[/]"
         line2 = f"  [cyan]{_escape(a.feed_name)}[/] · [dim]{date_str}[/]"
@@ -541,8 +545,7 @@ class BookmarkItem(ListItem):
         if a.insight:
             lines.append(f"  [green]{_escape(a.insight)}[/]")
         if self._memo:
-            preview = self._memo if len(self._memo) <= 50 else self._memo[:47] + "..."
-            lines.append(f"  [italic dim]{_escape(preview)}[/]")
+            lines.append(f"  [italic dim]{_escape(_memo_preview(self._memo))}[/]")
         return "\n".join(lines)
 
 
@@ -719,8 +722,9 @@ class TagItem(ListItem):
         self._count = count
 
     def compose(self) -> ComposeResult:
-        yield Static(self._format())
+        yield Static(self._format)
 
+    @cached_property
     def _format(self) -> str:
         return (
             f"[bold cyan]{_escape(self.tag)}[/]"
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import os
 import shutil
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -15,29 +16,40 @@ CONFIG_PATH = Path("~/.config/hawaiidisco/config.yml").expanduser()
 # Seed config bundled with the package (for development)
 _PACKAGE_DIR = Path(__file__).resolve().parent.parent
 _SEED_CONFIG = _PACKAGE_DIR / "config.example.yml"
-
-
-@dataclass
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+# Parsed config files keyed by (path, mtime_ns, size); only for read-only consumers
+_PARSE_CACHE: dict[tuple[str, int, int], dict] = {}
+_PARSE_CACHE_MAX = 16
+# Tiny documents whose parse result is known; skip the YAML parser for these
+_TRIVIAL_YAML: dict[bytes, Callable[[], dict]] = {
+    b"": dict,
+    b"feeds: []": lambda: {"feeds": []},
+}
+
+
+@dataclass(slots=True)
 class FeedConfig:
     url: str
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AIConfig:
     provider: str = "claude_cli"  # claude_cli | anthropic | openai
     api_key: str = ""
     model: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class InsightConfig:
     enabled: bool = True
     mode: str = "manual"  # auto | manual
     persona: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DigestConfig:
     enabled: bool = True
     period_days: int = 7
@@ -46,7 +58,7 @@ class DigestConfig:
     save_to_obsidian: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ObsidianConfig:
     enabled: bool = False
     vault_path: Path = field(default_factory=lambda: Path(""))
@@ -58,7 +70,7 @@ class ObsidianConfig:
     tags_prefix: str = "hawaiidisco"
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     language: str = "en"
     theme: str = "textual-dark"
@@ -81,6 +93,49 @@ def _resolve_env(value: str) -> str:
     return value
 
 
+def _read_yaml(path: Path) -> dict:
+    """Parse a YAML file into a dict. Return an empty dict if the file is missing or empty."""
+    if not path.exists():
+        return {}
+    data = path.read_bytes()
+    trivial = _TRIVIAL_YAML.get(data.strip())
+    if trivial is not None:
+        return trivial()
+    return yaml.load(data, Loader=_YAML_LOADER) or {}
+
+
+def _read_yaml_cached(path: Path) -> dict:
+    """Like ``_read_yaml`` but reuse the parsed dict while the file is unchanged.
+
+    "Unchanged" means same mtime and size, so a same-size rewrite within the
+    filesystem's mtime granularity is not noticed. The returned dict is shared
+    between callers and must not be mutated.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return {}
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    raw = _PARSE_CACHE.get(key)
+    if raw is None:
+        raw = _read_yaml(path)
+        if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX:
+            _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)))
+        _PARSE_CACHE[key] = raw
+    return raw
+
+
+def _clear_parse_cache() -> None:
+    """Forget every cached parse so the next load reads from disk."""
+    _PARSE_CACHE.clear()
+
+
+def _write_yaml(path: Path, raw: dict) -> None:
+    """Serialize *raw* to a YAML file, keeping key order and non-ASCII text as-is."""
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.dump(raw, f, Dumper=_YAML_DUMPER, allow_unicode=True, default_flow_style=False, sort_keys=False)
+
+
 def _prompt_yn(prompt: str, *, default: bool = True) -> bool:
     """Prompt for yes/no with a default. Returns bool."""
     suffix = " [Y/n]: " if default else " [y/N]: "
@@ -104,10 +159,7 @@ def load_config(path: Path | None = None) -> Config:
     _ensure_config()
     config_path = path or CONFIG_PATH
 
-    raw: dict = {}
-    if config_path.exists():
-        with open(config_path, encoding="utf-8") as f:
-            raw = yaml.safe_load(f) or {}
+    raw = _read_yaml_cached(config_path)
 
     language = raw.get("language", "en")
     set_lang(language)
@@ -182,10 +234,7 @@ def add_feed(feed: FeedConfig) -> None:
     """Add a feed entry to config.yml."""
     _ensure_config()
 
-    raw: dict = {}
-    if CONFIG_PATH.exists():
-        with open(CONFIG_PATH, encoding="utf-8") as f:
-            raw = yaml.safe_load(f) or {}
+    raw = _read_yaml(CONFIG_PATH)
 
     feeds = raw.get("feeds", [])
     # Skip duplicate URLs
@@ -195,18 +244,14 @@ def add_feed(feed: FeedConfig) -> None:
     raw["feeds"] = feeds
 
     CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        yaml.dump(raw, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+    _write_yaml(CONFIG_PATH, raw)
 
 
 def remove_feed(feed_url: str) -> bool:
     """Remove a feed entry from config.yml by URL. Return True if removed."""
     _ensure_config()
 
-    raw: dict = {}
-    if CONFIG_PATH.exists():
-        with open(CONFIG_PATH, encoding="utf-8") as f:
-            raw = yaml.safe_load(f) or {}
+    raw = _read_yaml(CONFIG_PATH)
 
     feeds = raw.get("feeds", [])
     original_len = len(feeds)
@@ -215,8 +260,7 @@ def remove_feed(feed_url: str) -> bool:
         return False
 
     raw["feeds"] = feeds
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        yaml.dump(raw, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+    _write_yaml(CONFIG_PATH, raw)
     return True
 
 
@@ -238,10 +282,7 @@ def setup_obsidian() -> None:
     _ensure_config()
 
     # Load existing config to detect language for i18n
-    raw: dict = {}
-    if CONFIG_PATH.exists():
-        with open(CONFIG_PATH, encoding="utf-8") as f:
-            raw = yaml.safe_load(f) or {}
+    raw = _read_yaml(CONFIG_PATH)
     set_lang(raw.get("language", "en"))
 
     try:
@@ -312,8 +353,7 @@ def _setup_obsidian_interactive(raw: dict) -> None:
     }
 
     CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        yaml.dump(raw, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+    _write_yaml(CONFIG_PATH, raw)
 
     print()
     print(t("setup_obsidian_complete", path=str(CONFIG_PATH)))
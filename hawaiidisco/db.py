@@ -2,8 +2,12 @@
 from __future__ import annotations
 
 import os
+import queue
 import sqlite3
 import threading
+import weakref
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -38,7 +42,8 @@ class Article:
 
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS articles (
-    id TEXT PRIMARY KEY,
+    seq INTEGER PRIMARY KEY,  -- explicit rowid: VACUUM keeps it, so the FTS index can key on it
+    id TEXT NOT NULL UNIQUE,
     feed_name TEXT NOT NULL,
     title TEXT NOT NULL,
     link TEXT NOT NULL,
@@ -52,9 +57,9 @@ CREATE TABLE IF NOT EXISTS articles (
 
 CREATE TABLE IF NOT EXISTS bookmarks (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    article_id TEXT NOT NULL REFERENCES articles(id),
+    article_id TEXT NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
     bookmarked_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    tags TEXT,
+    tags TEXT,  -- legacy comma-separated tags, superseded by bookmark_tags
     memo TEXT
 );
 
@@ -69,15 +74,118 @@ CREATE TABLE IF NOT EXISTS digests (
 """
 
 
+# Statements shared by several methods
+_SQL_INSERT_ARTICLE = (
+    "INSERT OR IGNORE INTO articles (id, feed_name, title, link, description, published_at) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SQL_CREATE_BOOKMARK_TAGS = (
+    "CREATE TABLE bookmark_tags ("
+    "article_id TEXT NOT NULL REFERENCES articles(id) ON DELETE CASCADE, "
+    "tag TEXT NOT NULL, "
+    "position INTEGER NOT NULL, "
+    "PRIMARY KEY (article_id, tag)) WITHOUT ROWID"
+)
+_SQL_INSERT_TAG = "INSERT OR IGNORE INTO bookmark_tags (article_id, tag, position) VALUES (?, ?, ?)"
+
+# Article columns in Article field order, so rows unpack positionally
+_ARTICLE_COLUMNS = (
+    "id, feed_name, title, link, description, published_at, fetched_at, "
+    "is_read, is_bookmarked, insight, translated_title, translated_desc, translated_body"
+)
+_ARTICLE_COLUMNS_A = ", ".join(f"a.{col}" for col in _ARTICLE_COLUMNS.split(", "))
+
+# Bookmarks newer than a ``datetime('now', ?)`` offset, newest first; walks idx_bookmarks_recent
+_SQL_RECENT_BOOKMARKS = (
+    f"SELECT {_ARTICLE_COLUMNS_A} FROM articles a JOIN bookmarks b ON a.id = b.article_id "
+    "WHERE b.bookmarked_at >= datetime('now', ?) ORDER BY b.bookmarked_at DESC, b.id DESC"
+)
+
+# Columns covered by get_articles(search=...)
+_FTS_COLUMNS = "title, description, insight, translated_title, translated_desc"
+_FTS_NEW = "new.title, new.description, new.insight, new.translated_title, new.translated_desc"
+_FTS_OLD = "old.title, old.description, old.insight, old.translated_title, old.translated_desc"
+_FTS_TRIGGERS = (
+    f"""CREATE TRIGGER articles_fts_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, {_FTS_COLUMNS}) VALUES (new.seq, {_FTS_NEW});
+END""",
+    f"""CREATE TRIGGER articles_fts_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, {_FTS_COLUMNS}) VALUES ('delete', old.seq, {_FTS_OLD});
+END""",
+    f"""CREATE TRIGGER articles_fts_au AFTER UPDATE OF {_FTS_COLUMNS} ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, {_FTS_COLUMNS}) VALUES ('delete', old.seq, {_FTS_OLD});
+    INSERT INTO articles_fts(rowid, {_FTS_COLUMNS}) VALUES (new.seq, {_FTS_NEW});
+END""",
+)
+
+# Keep feed_counts in step with articles so per-feed totals never scan the table
+_COUNT_TRIGGERS = (
+    """CREATE TRIGGER articles_ai_count AFTER INSERT ON articles BEGIN
+    INSERT INTO feed_counts (feed_name, n) VALUES (new.feed_name, 1)
+        ON CONFLICT(feed_name) DO UPDATE SET n = n + 1;
+END""",
+    """CREATE TRIGGER articles_ad_count AFTER DELETE ON articles BEGIN
+    UPDATE feed_counts SET n = n - 1 WHERE feed_name = old.feed_name;
+    DELETE FROM feed_counts WHERE feed_name = old.feed_name AND n <= 0;
+END""",
+    """CREATE TRIGGER articles_au_count AFTER UPDATE OF feed_name ON articles
+WHEN old.feed_name != new.feed_name BEGIN
+    UPDATE feed_counts SET n = n - 1 WHERE feed_name = old.feed_name;
+    DELETE FROM feed_counts WHERE feed_name = old.feed_name AND n <= 0;
+    INSERT INTO feed_counts (feed_name, n) VALUES (new.feed_name, 1)
+        ON CONFLICT(feed_name) DO UPDATE SET n = n + 1;
+END""",
+)
+
+# Bump whenever _migrate gains a step; migrated databases record it in PRAGMA user_version
+_SCHEMA_VERSION = 7
+
+# Per-connection tuning: in WAL mode NORMAL sync only fsyncs at checkpoints
+_CONNECTION_PRAGMAS = """
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+PRAGMA mmap_size=30000000000;
+PRAGMA foreign_keys=ON;
+"""
+
+# Upper bound on pooled connections for a file-backed database
+_POOL_SIZE = 4
+
+# Seconds to wait for a pooled connection before giving up; a nested _conn() call
+# holding the last connection would otherwise wait forever
+_POOL_TIMEOUT = 30.0
+
+
 class Database:
-    def __init__(self, db_path: Path) -> None:
+    def __init__(self, db_path: Path, pool_size: int = _POOL_SIZE) -> None:
         self.db_path = db_path
-        self._local = threading.local()
-        # Initialize schema on the main thread
-        conn = self._get_conn()
-        conn.executescript(SCHEMA_SQL)
-        self._migrate(conn)
-        conn.commit()
+        # Every connection to ":memory:" is its own database, so share a single one
+        self._pool_size = 1 if str(db_path) == ":memory:" else max(1, pool_size)
+        self._pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(maxsize=self._pool_size)
+        self._opened = 0
+        self._pool_lock = threading.Lock()
+        # Also close the pool when the Database is collected or the interpreter exits
+        weakref.finalize(self, _close_pool, self._pool)
+        with self._conn() as conn:
+            # Fully migrated databases are recognised by one PRAGMA read
+            if conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+                conn.executescript(SCHEMA_SQL)
+                # Table rebuilds must not fire ON DELETE CASCADE; the pragma is ignored inside a transaction
+                conn.execute("PRAGMA foreign_keys=OFF")
+                try:
+                    conn.execute("BEGIN IMMEDIATE")
+                    self._migrate(conn)
+                    conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+                    conn.execute("COMMIT")
+                finally:
+                    if conn.in_transaction:
+                        conn.rollback()
+                    conn.execute("PRAGMA foreign_keys=ON")
+            # Full-text search is optional: it needs an SQLite build with FTS5 trigram support
+            self._fts = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+            ).fetchone() is not None
         # Restrict database file to owner-only access
         if str(db_path) != ":memory:":
             try:
@@ -85,16 +193,69 @@ class Database:
             except OSError:
                 pass
 
-    def _get_conn(self) -> sqlite3.Connection:
-        """Return a thread-local database connection."""
-        conn = getattr(self._local, "conn", None)
-        if conn is None:
-            conn = sqlite3.connect(str(self.db_path))
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection that may be handed between threads by the pool."""
+        # Room for every get_articles filter combination plus the fixed statements
+        # Autocommit: writers open their own BEGIN IMMEDIATE via _write_tx
+        conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, cached_statements=256, isolation_level=None
+        )
+        if str(self.db_path) != ":memory:":
             conn.execute("PRAGMA journal_mode=WAL")
-            conn.row_factory = sqlite3.Row
-            self._local.conn = conn
+        conn.executescript(_CONNECTION_PRAGMAS)
+        conn.row_factory = sqlite3.Row
         return conn
 
+    @contextmanager
+    def _conn(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled connection for the duration of the ``with`` block.
+
+        Connections are opened lazily up to the pool size; further callers wait
+        up to ``_POOL_TIMEOUT`` seconds for one to be returned, then raise
+        ``RuntimeError``. Any transaction left open is rolled back on return.
+        """
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                can_open = self._opened < self._pool_size
+                if can_open:
+                    self._opened += 1
+            if can_open:
+                try:
+                    conn = self._connect()
+                except BaseException:
+                    with self._pool_lock:
+                        self._opened -= 1
+                    raise
+            else:
+                try:
+                    conn = self._pool.get(timeout=_POOL_TIMEOUT)
+                except queue.Empty:
+                    raise RuntimeError(
+                        f"No database connection was returned to the pool within {_POOL_TIMEOUT}s "
+                        f"(pool size {self._pool_size}); is _conn() being borrowed re-entrantly?"
+                    ) from None
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._pool.put(conn)
+
+    @contextmanager
+    def _write_tx(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled connection inside a ``BEGIN IMMEDIATE`` transaction.
+
+        The write lock is taken up front, so concurrent writers queue on the busy
+        timeout instead of failing a deferred lock upgrade. The transaction commits
+        when the block exits normally; on error ``_conn`` rolls it back.
+        """
+        with self._conn() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            conn.execute("COMMIT")
+
     def _migrate(self, conn: sqlite3.Connection) -> None:
         """Add new columns and indexes to existing tables if missing."""
         cursor = conn.execute("PRAGMA table_info(articles)")
@@ -105,6 +266,52 @@ class Database:
             conn.execute("ALTER TABLE articles ADD COLUMN translated_desc TEXT")
         if "translated_body" not in columns:
             conn.execute("ALTER TABLE articles ADD COLUMN translated_body TEXT")
+        # Older tables keyed the FTS index on the implicit rowid, which VACUUM may renumber;
+        # rebuild with an explicit INTEGER PRIMARY KEY, keeping the current rowids
+        if "seq" not in columns:
+            conn.execute(
+                "CREATE TABLE articles_new ("
+                "seq INTEGER PRIMARY KEY, "
+                "id TEXT NOT NULL UNIQUE, "
+                "feed_name TEXT NOT NULL, "
+                "title TEXT NOT NULL, "
+                "link TEXT NOT NULL, "
+                "description TEXT, "
+                "published_at DATETIME, "
+                "fetched_at DATETIME DEFAULT CURRENT_TIMESTAMP, "
+                "is_read INTEGER DEFAULT 0, "
+                "is_bookmarked INTEGER DEFAULT 0, "
+                "insight TEXT, "
+                "translated_title TEXT, "
+                "translated_desc TEXT, "
+                "translated_body TEXT)"
+            )
+            conn.execute(
+                f"INSERT INTO articles_new (seq, {_ARTICLE_COLUMNS}) SELECT rowid, {_ARTICLE_COLUMNS} FROM articles"
+            )
+            # Dropping articles also drops its indexes and triggers; the steps below recreate them
+            conn.execute("DROP TABLE articles")
+            conn.execute("ALTER TABLE articles_new RENAME TO articles")
+            conn.execute("DROP TABLE IF EXISTS articles_fts")
+            conn.execute("DROP TABLE IF EXISTS feed_counts")
+        # Bookmarks follow their article on delete; older tables lack the cascade and are rebuilt
+        fk_actions = {row[6] for row in conn.execute("PRAGMA foreign_key_list(bookmarks)")}
+        if fk_actions != {"CASCADE"}:
+            conn.execute(
+                "CREATE TABLE bookmarks_new ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "article_id TEXT NOT NULL REFERENCES articles(id) ON DELETE CASCADE, "
+                "bookmarked_at DATETIME DEFAULT CURRENT_TIMESTAMP, "
+                "tags TEXT, "
+                "memo TEXT)"
+            )
+            conn.execute(
+                "INSERT INTO bookmarks_new (id, article_id, bookmarked_at, tags, memo) "
+                "SELECT id, article_id, bookmarked_at, tags, memo FROM bookmarks "
+                "WHERE article_id IN (SELECT id FROM articles)"
+            )
+            conn.execute("DROP TABLE bookmarks")
+            conn.execute("ALTER TABLE bookmarks_new RENAME TO bookmarks")
         # Performance indexes for common query patterns
         conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_articles_published "
@@ -118,17 +325,81 @@ class Database:
             "CREATE INDEX IF NOT EXISTS idx_articles_read "
             "ON articles(is_read, published_at DESC)"
         )
+        # Bookmark memo lookups and toggles go by article_id
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_bookmarks_article ON bookmarks(article_id)")
+        # Walks recent bookmarks in display order, tie-breaker included, without a sort step
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_bookmarks_recent "
+            "ON bookmarks(bookmarked_at DESC, id DESC, article_id)"
+        )
+        # Normalized bookmark tags (replaces the comma-separated bookmarks.tags column)
+        tag_table = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'bookmark_tags'"
+        ).fetchone()
+        if tag_table is None:
+            conn.execute(_SQL_CREATE_BOOKMARK_TAGS)
+            conn.execute("CREATE INDEX idx_bookmark_tags_tag ON bookmark_tags(tag)")
+            legacy = conn.execute(
+                "SELECT article_id, tags FROM bookmarks WHERE tags IS NOT NULL AND tags != ''"
+            ).fetchall()
+            conn.executemany(
+                _SQL_INSERT_TAG,
+                [
+                    (row[0], tag, pos)
+                    for row in legacy
+                    for pos, tag in enumerate(t.strip() for t in row[1].split(",") if t.strip())
+                ],
+            )
+        elif "WITHOUT ROWID" not in tag_table[0]:
+            # Earlier versions kept a separate rowid b-tree behind the primary key
+            conn.execute("ALTER TABLE bookmark_tags RENAME TO bookmark_tags_old")
+            conn.execute(_SQL_CREATE_BOOKMARK_TAGS)
+            conn.execute(
+                "INSERT INTO bookmark_tags (article_id, tag, position) "
+                "SELECT article_id, tag, position FROM bookmark_tags_old"
+            )
+            conn.execute("DROP TABLE bookmark_tags_old")
+            conn.execute("CREATE INDEX idx_bookmark_tags_tag ON bookmark_tags(tag)")
+        # Trigram full-text index over the searchable article columns, kept in sync by triggers
+        has_fts = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+        ).fetchone()
+        if not has_fts:
+            try:
+                conn.execute(
+                    f"CREATE VIRTUAL TABLE articles_fts USING fts5({_FTS_COLUMNS}, "
+                    "content='articles', content_rowid='seq', tokenize='trigram')"
+                )
+            except sqlite3.OperationalError:
+                pass  # FTS5 or the trigram tokenizer is not compiled in; search falls back to LIKE
+            else:
+                for trigger in _FTS_TRIGGERS:
+                    conn.execute(trigger)
+                conn.execute("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')")
+        # Per-feed article totals maintained by triggers
+        has_counts = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'feed_counts'"
+        ).fetchone()
+        if not has_counts:
+            conn.execute(
+                "CREATE TABLE feed_counts (feed_name TEXT PRIMARY KEY, n INTEGER NOT NULL) WITHOUT ROWID"
+            )
+            for trigger in _COUNT_TRIGGERS:
+                conn.execute(trigger)
+            conn.execute(
+                "INSERT INTO feed_counts (feed_name, n) "
+                "SELECT feed_name, COUNT(*) FROM articles GROUP BY feed_name"
+            )
         # Digest table migrations
         digest_cols = {row[1] for row in conn.execute("PRAGMA table_info(digests)").fetchall()}
         if "article_ids_hash" not in digest_cols:
             conn.execute("ALTER TABLE digests ADD COLUMN article_ids_hash TEXT DEFAULT ''")
 
-
     def close(self) -> None:
-        conn = getattr(self._local, "conn", None)
-        if conn:
-            conn.close()
-            self._local.conn = None
+        """Close every idle pooled connection, refreshing planner statistics first."""
+        closed = _close_pool(self._pool)
+        with self._pool_lock:
+            self._opened -= closed
 
     # --- Article Operations ---
 
@@ -142,14 +413,25 @@ class Database:
         published_at: datetime | None,
     ) -> bool:
         """Insert an article or ignore if it already exists. Return True if newly inserted."""
-        cursor = self._get_conn().execute(
-            "INSERT OR IGNORE INTO articles (id, feed_name, title, link, description, published_at) "
-            "VALUES (?, ?, ?, ?, ?, ?)",
-            (article_id, feed_name, title, link, description, published_at),
-        )
-        self._get_conn().commit()
+        with self._write_tx() as conn:
+            cursor = conn.execute(
+                _SQL_INSERT_ARTICLE,
+                (article_id, feed_name, title, link, description, published_at),
+            )
         return cursor.rowcount > 0
 
+    def upsert_articles(
+        self,
+        rows: Iterable[tuple[str, str, str, str, str | None, datetime | None]],
+    ) -> int:
+        """Insert many articles in one transaction, ignoring existing IDs. Return the count inserted.
+
+        Each row is ``(id, feed_name, title, link, description, published_at)``.
+        """
+        with self._write_tx() as conn:
+            cursor = conn.executemany(_SQL_INSERT_ARTICLE, rows)
+        return max(cursor.rowcount, 0)
+
     def get_articles(
         self,
         *,
@@ -160,44 +442,50 @@ class Database:
         limit: int = 200,
     ) -> list[Article]:
         """Return a list of articles ordered by most recent first."""
-        query = "SELECT * FROM articles WHERE 1=1"
+        conds: list[str] = []
         params: list = []
         if bookmarked_only:
-            query += " AND is_bookmarked = 1"
+            conds.append("is_bookmarked = 1")
         if unread_only:
-            query += " AND is_read = 0"
+            conds.append("is_read = 0")
         if feed_name:
-            query += " AND feed_name = ?"
+            conds.append("feed_name = ?")
             params.append(feed_name)
-        if search:
+        if search and self._fts and len(search) >= 3:
+            # A quoted phrase against the trigram index matches any substring of 3+ characters
+            conds.append("seq IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?)")
+            params.append('"' + search.replace('"', '""') + '"')
+        elif search:
             # Escape LIKE wildcard characters
             escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-            pattern = f"%{escaped}%"
-            query += (
-                " AND (title LIKE ? ESCAPE '\\'"
+            conds.append(
+                "(title LIKE ? ESCAPE '\\'"
                 " OR description LIKE ? ESCAPE '\\'"
                 " OR insight LIKE ? ESCAPE '\\'"
                 " OR translated_title LIKE ? ESCAPE '\\'"
                 " OR translated_desc LIKE ? ESCAPE '\\')"
             )
-            params.extend([pattern] * 5)
-        query += " ORDER BY published_at DESC, fetched_at DESC LIMIT ?"
+            params.extend([f"%{escaped}%"] * 5)
+        where = f" WHERE {' AND '.join(conds)}" if conds else ""
+        query = f"SELECT {_ARTICLE_COLUMNS} FROM articles{where} ORDER BY published_at DESC, fetched_at DESC LIMIT ?"
         params.append(limit)
 
-        rows = self._get_conn().execute(query, params).fetchall()
+        with self._conn() as conn:
+            rows = conn.execute(query, params).fetchall()
         return [self._row_to_article(row) for row in rows]
 
     def get_article(self, article_id: str) -> Article | None:
-        row = self._get_conn().execute(
-            "SELECT * FROM articles WHERE id = ?", (article_id,)
-        ).fetchone()
+        with self._conn() as conn:
+            row = conn.execute(
+                f"SELECT {_ARTICLE_COLUMNS} FROM articles WHERE id = ?", (article_id,)
+            ).fetchone()
         return self._row_to_article(row) if row else None
 
     def mark_read(self, article_id: str) -> None:
-        self._get_conn().execute(
-            "UPDATE articles SET is_read = 1 WHERE id = ?", (article_id,)
-        )
-        self._get_conn().commit()
+        with self._write_tx() as conn:
+            conn.execute(
+                "UPDATE articles SET is_read = 1 WHERE id = ?", (article_id,)
+            )
 
     def toggle_read(self, article_id: str) -> bool:
         """Toggle the read state of an article. Return the new state."""
@@ -205,186 +493,175 @@ class Database:
         if not article:
             return False
         new_state = not article.is_read
-        self._get_conn().execute(
-            "UPDATE articles SET is_read = ? WHERE id = ?",
-            (int(new_state), article_id),
-        )
-        self._get_conn().commit()
+        with self._write_tx() as conn:
+            conn.execute(
+                "UPDATE articles SET is_read = ? WHERE id = ?",
+                (int(new_state), article_id),
+            )
         return new_state
 
     def mark_all_read(self, *, feed_name: str | None = None) -> int:
         """Mark articles as read. Optionally filter by feed. Return count of updated rows."""
-        if feed_name:
-            cursor = self._get_conn().execute(
-                "UPDATE articles SET is_read = 1 WHERE is_read = 0 AND feed_name = ?",
-                (feed_name,),
-            )
-        else:
-            cursor = self._get_conn().execute(
-                "UPDATE articles SET is_read = 1 WHERE is_read = 0"
-            )
-        self._get_conn().commit()
+        with self._write_tx() as conn:
+            if feed_name:
+                cursor = conn.execute(
+                    "UPDATE articles SET is_read = 1 WHERE is_read = 0 AND feed_name = ?",
+                    (feed_name,),
+                )
+            else:
+                cursor = conn.execute(
+                    "UPDATE articles SET is_read = 1 WHERE is_read = 0"
+                )
         return cursor.rowcount
 
     def toggle_bookmark(self, article_id: str) -> bool:
         """Toggle the bookmark state of an article. Return the new state."""
-        article = self.get_article(article_id)
-        if not article:
-            return False
-        new_state = not article.is_bookmarked
-        self._get_conn().execute(
-            "UPDATE articles SET is_bookmarked = ? WHERE id = ?",
-            (int(new_state), article_id),
-        )
-        if new_state:
-            self._get_conn().execute(
-                "INSERT INTO bookmarks (article_id) VALUES (?)", (article_id,)
-            )
-        else:
-            self._get_conn().execute(
+        # Check and write under one write lock so a concurrent delete cannot slip between them
+        with self._write_tx() as conn:
+            removed = conn.execute(
                 "DELETE FROM bookmarks WHERE article_id = ?", (article_id,)
+            ).rowcount
+            if removed:
+                conn.execute(
+                    "DELETE FROM bookmark_tags WHERE article_id = ?", (article_id,)
+                )
+            else:
+                inserted = conn.execute(
+                    "INSERT INTO bookmarks (article_id) SELECT id FROM articles WHERE id = ?",
+                    (article_id,),
+                ).rowcount
+                if not inserted:
+                    return False
+            new_state = not removed
+            conn.execute(
+                "UPDATE articles SET is_bookmarked = ? WHERE id = ?",
+                (int(new_state), article_id),
             )
-        self._get_conn().commit()
         return new_state
 
     def set_insight(self, article_id: str, insight: str) -> None:
-        self._get_conn().execute(
-            "UPDATE articles SET insight = ? WHERE id = ?", (insight, article_id)
-        )
-        self._get_conn().commit()
+        with self._write_tx() as conn:
+            conn.execute(
+                "UPDATE articles SET insight = ? WHERE id = ?", (insight, article_id)
+            )
 
     def set_translation(self, article_id: str, title: str, desc: str) -> None:
-        self._get_conn().execute(
-            "UPDATE articles SET translated_title = ?, translated_desc = ? WHERE id = ?",
-            (title, desc, article_id),
-        )
-        self._get_conn().commit()
+        with self._write_tx() as conn:
+            conn.execute(
+                "UPDATE articles SET translated_title = ?, translated_desc = ? WHERE id = ?",
+                (title, desc, article_id),
+            )
 
     def set_translated_body(self, article_id: str, translated_body: str) -> None:
-        self._get_conn().execute(
-            "UPDATE articles SET translated_body = ? WHERE id = ?",
-            (translated_body, article_id),
-        )
-        self._get_conn().commit()
+        with self._write_tx() as conn:
+            conn.execute(
+                "UPDATE articles SET translated_body = ? WHERE id = ?",
+                (translated_body, article_id),
+            )
 
     def get_translated_body(self, article_id: str) -> str | None:
-        row = self._get_conn().execute(
-            "SELECT translated_body FROM articles WHERE id = ?", (article_id,)
-        ).fetchone()
+        with self._conn() as conn:
+            row = conn.execute(
+                "SELECT translated_body FROM articles WHERE id = ?", (article_id,)
+            ).fetchone()
         return row["translated_body"] if row else None
 
     def set_bookmark_memo(self, article_id: str, memo: str) -> None:
-        self._get_conn().execute(
-            "UPDATE bookmarks SET memo = ? WHERE article_id = ?",
-            (memo, article_id),
-        )
-        self._get_conn().commit()
+        with self._write_tx() as conn:
+            conn.execute(
+                "UPDATE bookmarks SET memo = ? WHERE article_id = ?",
+                (memo, article_id),
+            )
 
     def get_bookmark_memo(self, article_id: str) -> str | None:
-        row = self._get_conn().execute(
-            "SELECT memo FROM bookmarks WHERE article_id = ?", (article_id,)
-        ).fetchone()
+        with self._conn() as conn:
+            row = conn.execute(
+                "SELECT memo FROM bookmarks WHERE article_id = ?", (article_id,)
+            ).fetchone()
         return row["memo"] if row else None
 
     def delete_articles_by_feed(self, feed_name: str) -> int:
         """Delete all articles (and their bookmarks) belonging to a feed. Return deleted count."""
-        conn = self._get_conn()
-        # Delete bookmark FK references first
-        conn.execute(
-            "DELETE FROM bookmarks WHERE article_id IN "
-            "(SELECT id FROM articles WHERE feed_name = ?)",
-            (feed_name,),
-        )
-        cursor = conn.execute(
-            "DELETE FROM articles WHERE feed_name = ?", (feed_name,)
-        )
-        conn.commit()
+        with self._write_tx() as conn:
+            # Bookmarks and their tags go with the articles via ON DELETE CASCADE
+            cursor = conn.execute(
+                "DELETE FROM articles WHERE feed_name = ?", (feed_name,)
+            )
         return cursor.rowcount
 
     # --- Tag Operations ---
 
     def set_bookmark_tags(self, article_id: str, tags: list[str]) -> None:
-        """Save bookmark tags. Sets to NULL if the list is empty."""
-        value = ",".join(t.strip() for t in tags if t.strip()) or None
-        self._get_conn().execute(
-            "UPDATE bookmarks SET tags = ? WHERE article_id = ?",
-            (value, article_id),
-        )
-        self._get_conn().commit()
+        """Replace a bookmark's tags, keeping their order. Does nothing if the article is not bookmarked."""
+        cleaned = [t.strip() for t in tags if t.strip()]
+        with self._write_tx() as conn:
+            if not conn.execute(
+                "SELECT 1 FROM bookmarks WHERE article_id = ?", (article_id,)
+            ).fetchone():
+                return
+            conn.execute("DELETE FROM bookmark_tags WHERE article_id = ?", (article_id,))
+            conn.executemany(_SQL_INSERT_TAG, [(article_id, tag, pos) for pos, tag in enumerate(cleaned)])
 
     def get_bookmark_tags(self, article_id: str) -> list[str]:
         """Return the tag list for a bookmark."""
-        row = self._get_conn().execute(
-            "SELECT tags FROM bookmarks WHERE article_id = ?", (article_id,)
-        ).fetchone()
-        if not row or not row["tags"]:
-            return []
-        return [t.strip() for t in row["tags"].split(",") if t.strip()]
+        with self._conn() as conn:
+            rows = conn.execute(
+                "SELECT tag FROM bookmark_tags WHERE article_id = ? ORDER BY position",
+                (article_id,),
+            ).fetchall()
+        return [row["tag"] for row in rows]
 
     def get_all_tags(self) -> list[str]:
         """Return all unique tags sorted."""
-        rows = self._get_conn().execute(
-            "SELECT tags FROM bookmarks WHERE tags IS NOT NULL AND tags != ''"
-        ).fetchall()
-        tag_set: set[str] = set()
-        for row in rows:
-            for tag in row["tags"].split(","):
-                stripped = tag.strip()
-                if stripped:
-                    tag_set.add(stripped)
-        return sorted(tag_set)
+        with self._conn() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT tag FROM bookmark_tags ORDER BY tag"
+            ).fetchall()
+        return [row["tag"] for row in rows]
 
     def get_articles_by_tag(self, tag: str) -> list[Article]:
         """Return bookmarked articles with the given tag."""
-        # Exact tag matching in comma-separated string: start/middle/end patterns
-        rows = self._get_conn().execute(
-            "SELECT a.* FROM articles a JOIN bookmarks b ON a.id = b.article_id "
-            "WHERE b.tags = ? "
-            "OR b.tags LIKE ? "
-            "OR b.tags LIKE ? "
-            "OR b.tags LIKE ? "
-            "ORDER BY a.published_at DESC, a.fetched_at DESC",
-            (tag, f"{tag},%", f"%,{tag},%", f"%,{tag}"),
-        ).fetchall()
+        with self._conn() as conn:
+            rows = conn.execute(
+                f"SELECT {_ARTICLE_COLUMNS_A} FROM articles a JOIN bookmark_tags t ON a.id = t.article_id "
+                "WHERE t.tag = ? "
+                "ORDER BY a.published_at DESC, a.fetched_at DESC",
+                (tag,),
+            ).fetchall()
         return [self._row_to_article(row) for row in rows]
 
     def get_all_bookmark_tags(self) -> dict[str, list[str]]:
         """Return all bookmark tags as ``{article_id: [tags]}``."""
-        rows = self._get_conn().execute(
-            "SELECT article_id, tags FROM bookmarks "
-            "WHERE tags IS NOT NULL AND tags != ''"
-        ).fetchall()
-        result: dict[str, list[str]] = {}
-        for row in rows:
-            tags = [t.strip() for t in row["tags"].split(",") if t.strip()]
-            if tags:
-                result[row["article_id"]] = tags
-        return result
+        with self._conn() as conn:
+            rows = conn.execute(
+                "SELECT article_id, tag FROM bookmark_tags ORDER BY article_id, position"
+            ).fetchall()
+        tags: dict[str, list[str]] = {}
+        for article_id, tag in rows:
+            tags.setdefault(article_id, []).append(tag)
+        return tags
 
     # --- Feed / Bookmark Statistics ---
 
     def get_article_count_by_feed(self) -> dict[str, int]:
         """Return article counts grouped by feed name."""
-        rows = self._get_conn().execute(
-            "SELECT feed_name, COUNT(*) as cnt FROM articles GROUP BY feed_name"
-        ).fetchall()
-        return {row["feed_name"]: row["cnt"] for row in rows}
+        with self._conn() as conn:
+            rows = conn.execute("SELECT feed_name, n FROM feed_counts").fetchall()
+        return {row["feed_name"]: row["n"] for row in rows}
 
     def get_all_bookmark_memos(self) -> dict[str, str]:
         """Return all bookmark memos as ``{article_id: memo}``."""
-        rows = self._get_conn().execute(
-            "SELECT article_id, memo FROM bookmarks "
-            "WHERE memo IS NOT NULL AND memo != ''"
-        ).fetchall()
-        return {row["article_id"]: row["memo"] for row in rows}
+        with self._conn() as conn:
+            rows = conn.execute(
+                "SELECT article_id, memo FROM bookmarks "
+                "WHERE memo IS NOT NULL AND memo != ''"
+            ).fetchall()
+        return dict(rows)
 
     def get_recent_bookmarked_articles(self, days: int = 7) -> list[Article]:
         """Return articles bookmarked within the last N days."""
-        rows = self._get_conn().execute(
-            "SELECT a.* FROM articles a JOIN bookmarks b ON a.id = b.article_id "
-            "WHERE b.bookmarked_at >= datetime('now', ?) ORDER BY b.bookmarked_at DESC, b.id DESC",
-            (f"-{days} days",),
-        ).fetchall()
+        with self._conn() as conn:
+            rows = conn.execute(_SQL_RECENT_BOOKMARKS, (f"-{days} days",)).fetchall()
         return [self._row_to_article(row) for row in rows]
 
     # --- Digest Operations ---
@@ -393,20 +670,21 @@ class Database:
         self, period_days: int, article_count: int, content: str, article_ids_hash: str = ""
     ) -> int:
         """Save a digest and return its ID."""
-        cursor = self._get_conn().execute(
-            "INSERT INTO digests (period_days, article_count, content, article_ids_hash) "
-            "VALUES (?, ?, ?, ?)",
-            (period_days, article_count, content, article_ids_hash),
-        )
-        self._get_conn().commit()
+        with self._write_tx() as conn:
+            cursor = conn.execute(
+                "INSERT INTO digests (period_days, article_count, content, article_ids_hash) "
+                "VALUES (?, ?, ?, ?)",
+                (period_days, article_count, content, article_ids_hash),
+            )
         return cursor.lastrowid  # type: ignore[return-value]
 
     def get_latest_digest(self, period_days: int = 7) -> Digest | None:
         """Return the most recent digest for the given period, or None."""
-        row = self._get_conn().execute(
-            "SELECT * FROM digests WHERE period_days = ? ORDER BY created_at DESC LIMIT 1",
-            (period_days,),
-        ).fetchone()
+        with self._conn() as conn:
+            row = conn.execute(
+                "SELECT * FROM digests WHERE period_days = ? ORDER BY created_at DESC LIMIT 1",
+                (period_days,),
+            ).fetchone()
         if not row:
             return None
         return Digest(
@@ -420,36 +698,57 @@ class Database:
 
     def get_recent_articles(self, days: int = 7, limit: int = 20) -> list[Article]:
         """Return articles from the last N days, ordered by most recent."""
-        rows = self._get_conn().execute(
-            "SELECT * FROM articles "
-            "WHERE published_at >= datetime('now', ?) OR fetched_at >= datetime('now', ?) "
-            "ORDER BY published_at DESC, fetched_at DESC LIMIT ?",
-            (f"-{days} days", f"-{days} days", limit),
-        ).fetchall()
+        with self._conn() as conn:
+            rows = conn.execute(
+                f"SELECT {_ARTICLE_COLUMNS} FROM articles "
+                "WHERE published_at >= datetime('now', ?) OR fetched_at >= datetime('now', ?) "
+                "ORDER BY published_at DESC, fetched_at DESC LIMIT ?",
+                (f"-{days} days", f"-{days} days", limit),
+            ).fetchall()
         return [self._row_to_article(row) for row in rows]
 
     # --- Internal Utilities ---
 
     @staticmethod
     def _row_to_article(row: sqlite3.Row) -> Article:
-        keys = row.keys()
+        """Build an Article from a row selected with ``_ARTICLE_COLUMNS``."""
+        (
+            id_, feed_name, title, link, description, published_at, fetched_at,
+            is_read, is_bookmarked, insight, translated_title, translated_desc, translated_body,
+        ) = row
         return Article(
-            id=row["id"],
-            feed_name=row["feed_name"],
-            title=row["title"],
-            link=row["link"],
-            description=row["description"],
-            published_at=_parse_dt(row["published_at"]),
-            fetched_at=_parse_dt(row["fetched_at"]) or datetime.now(),
-            is_read=bool(row["is_read"]),
-            is_bookmarked=bool(row["is_bookmarked"]),
-            insight=row["insight"],
-            translated_title=row["translated_title"] if "translated_title" in keys else None,
-            translated_desc=row["translated_desc"] if "translated_desc" in keys else None,
-            translated_body=row["translated_body"] if "translated_body" in keys else None,
+            id_,
+            feed_name,
+            title,
+            link,
+            description,
+            _parse_dt(published_at),
+            _parse_dt(fetched_at) or datetime.now(),
+            bool(is_read),
+            bool(is_bookmarked),
+            insight,
+            translated_title,
+            translated_desc,
+            translated_body,
         )
 
 
+def _close_pool(pool: queue.LifoQueue[sqlite3.Connection]) -> int:
+    """Run ``PRAGMA optimize`` on and close every idle connection in *pool*. Return the count closed."""
+    closed = 0
+    while True:
+        try:
+            conn = pool.get_nowait()
+        except queue.Empty:
+            return closed
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
+        conn.close()
+        closed += 1
+
+
 def _parse_dt(value: str | None) -> datetime | None:
     if not value:
         return None
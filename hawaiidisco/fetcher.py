@@ -60,7 +60,7 @@ def fetch_feed(feed_config: FeedConfig, db: Database, *, allow_insecure_ssl: boo
             handlers=[_make_ssl_handler()],
         )
 
-    new_count = 0
+    rows = []
     for entry in parsed.entries:
         article_id = _make_article_id(entry, feed_config.name)
         title = entry.get("title", t("no_title"))
@@ -72,19 +72,10 @@ def fetch_feed(feed_config: FeedConfig, db: Database, *, allow_insecure_ssl: boo
             if len(description) > 500:
                 description = description[:500] + "..."
         published_at = _parse_published(entry)
+        rows.append((article_id, feed_config.name, title, link, description, published_at))
 
-        is_new = db.upsert_article(
-            article_id=article_id,
-            feed_name=feed_config.name,
-            title=title,
-            link=link,
-            description=description,
-            published_at=published_at,
-        )
-        if is_new:
-            new_count += 1
-
-    return new_count
+    # One transaction per feed instead of one commit per entry
+    return db.upsert_articles(rows)
 
 
 def fetch_all_feeds(feeds: list[FeedConfig], db: Database, *, allow_insecure_ssl: bool = False) -> int:
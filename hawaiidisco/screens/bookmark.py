@@ -1,6 +1,8 @@
 """Bookmark list screen."""
 from __future__ import annotations
 
+from functools import cached_property
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical
@@ -13,6 +15,17 @@ from hawaiidisco.i18n import t
 from hawaiidisco.utils import _escape
 
 
+# Longest memo shown in a bookmark row, ellipsis included
+_MEMO_PREVIEW_LEN = 50
+
+
+def _memo_preview(memo: str) -> str:
+    """Shorten *memo* to at most ``_MEMO_PREVIEW_LEN`` characters for a list row."""
+    if len(memo) <= _MEMO_PREVIEW_LEN:
+        return memo
+    return memo[: _MEMO_PREVIEW_LEN - 3] + "..."
+
+
 class BookmarkItem(ListItem):
     """Individual item in the bookmark list."""
 
@@ -28,15 +41,16 @@ class BookmarkItem(ListItem):
         self._tags = tags or []
 
     def compose(self) -> ComposeResult:
-        yield Static(self._format())
+        yield Static(self._format)
 
+    @cached_property
     def _format(self) -> str:
         a = self.article
         date_str = ""
         if a.published_at:
-            date_str = a.published_at.strftime("%Y-%m-%d")
+            date_str = a.published_at.date().isoformat()
         elif a.fetched_at:
-            date_str = a.fetched_at.strftime("%Y-%m-%d")
+            date_str = a.fetched_at.date().isoformat()
 
         line1 = f"[bold yellow]★[/] [bold]{_escape(a.title)}[/]"
         line2 = f"  [cyan]{_escape(a.feed_name)}[/] · [dim]{date_str}[/]"
@@ -46,8 +60,7 @@ class BookmarkItem(ListItem):
         if a.insight:
             lines.append(f"  [green]{_escape(a.insight)}[/]")
         if self._memo:
-            preview = self._memo if len(self._memo) <= 50 else self._memo[:47] + "..."
-            lines.append(f"  [italic dim]{_escape(preview)}[/]")
+            lines.append(f"  [italic dim]{_escape(_memo_preview(self._memo))}[/]")
         return "\n".join(lines)
 
 
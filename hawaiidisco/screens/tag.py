@@ -1,6 +1,8 @@
 """Tag management screens."""
 from __future__ import annotations
 
+from functools import cached_property
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical
@@ -57,8 +59,9 @@ class TagItem(ListItem):
         self._count = count
 
     def compose(self) -> ComposeResult:
-        yield Static(self._format())
+        yield Static(self._format)
 
+    @cached_property
     def _format(self) -> str:
         return (
             f"[bold cyan]{_escape(self.tag)}[/]"
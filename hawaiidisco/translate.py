@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 
 from hawaiidisco.ai.base import AIProvider
 from hawaiidisco.ai.prompts import (
@@ -17,6 +18,12 @@ from hawaiidisco.i18n import get_lang, t
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _body_prompt_for(lang: str) -> str:
+    """Return the body translation prompt with the output language already filled in."""
+    return TRANSLATE_BODY_PROMPT.replace("{output_language}", get_lang_name(lang))
+
+
 def translate_text(text: str, provider: AIProvider, *, timeout: int = 120, lang: str = "") -> str | None:
     """Translate text using the AI provider."""
     if not provider.is_available() or not text:
@@ -28,10 +35,7 @@ def translate_text(text: str, provider: AIProvider, *, timeout: int = 120, lang:
 
     # Limit long text to 10,000 characters
     truncated = text[:10000]
-    prompt = TRANSLATE_BODY_PROMPT.format(
-        output_language=get_lang_name(lang),
-        text=truncated,
-    )
+    prompt = _body_prompt_for(lang).format(text=truncated)
 
     return provider.generate(prompt, timeout=timeout)
 
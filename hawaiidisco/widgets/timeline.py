@@ -127,15 +127,14 @@ class Timeline(ListView):
         self._articles = articles
         tags = tags or {}
         self.clear()
-        for article in articles:
+        id_to_index: dict[str, int] = {}
+        for i, article in enumerate(articles):
             self.append(ArticleItem(article, tags.get(article.id)))
+            id_to_index[article.id] = i
 
         # Restore previous highlight position
         if current_id:
-            for i, article in enumerate(articles):
-                if article.id == current_id:
-                    self.index = i
-                    break
+            self.index = id_to_index.get(current_id, self.index)
 
     def get_highlighted_article(self) -> Article | None:
         """Return the currently highlighted article."""
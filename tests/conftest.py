@@ -0,0 +1,33 @@
+"""Shared fixtures."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hawaiidisco.config import Config, load_config
+from hawaiidisco.i18n import get_lang, set_lang
+
+
+@pytest.fixture(autouse=True)
+def _restore_lang() -> Iterator[None]:
+    """Restore the global UI language after each test; load_config and set_lang change it."""
+    prev = get_lang()
+    yield
+    set_lang(prev.value)
+
+
+@pytest.fixture(scope="session")
+def executor() -> Iterator[ThreadPoolExecutor]:
+    """Share one worker pool across the threaded tests."""
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        yield pool
+
+
+@pytest.fixture(scope="session")
+def default_config(tmp_path_factory: pytest.TempPathFactory) -> Config:
+    """Return a Config loaded once from a minimal ``feeds: []`` file. Treat as read-only."""
+    path = tmp_path_factory.mktemp("cfg") / "config.yml"
+    path.write_bytes(b"feeds: []\n")
+    return load_config(path)
@@ -0,0 +1,30 @@
+"""Shared test doubles and assertion helpers."""
+from __future__ import annotations
+
+
+def _missing(text: str, needles: list[str]) -> list[str]:
+    """Return the *needles* not found in *text*, so one assert reports them all."""
+    return [needle for needle in needles if needle not in text]
+
+
+def _present(text: str, needles: list[str]) -> list[str]:
+    """Return the *needles* found in *text*; the negative counterpart of ``_missing``."""
+    return [needle for needle in needles if needle in text]
+
+
+class _FakeProvider:
+    """Minimal AIProvider that records prompts and returns ``response``."""
+
+    name = "mock"
+
+    def __init__(self, response: str | None = "AI response", *, available: bool = True) -> None:
+        self.response = response
+        self.available = available
+        self.calls: list[tuple[str, dict]] = []
+
+    def is_available(self) -> bool:
+        return self.available
+
+    def generate(self, prompt: str, **kwargs) -> str | None:
+        self.calls.append((prompt, kwargs))
+        return self.response
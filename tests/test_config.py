@@ -1,14 +1,46 @@
 """Tests for configuration loading."""
 from __future__ import annotations
 
+import io
+import os
 from pathlib import Path
 
 import pytest
 import yaml
 
-from hawaiidisco.config import load_config, _resolve_env, _prompt_yn, remove_feed, setup_obsidian
+from hawaiidisco.config import (
+    Config,
+    _clear_parse_cache,
+    _prompt_yn,
+    _resolve_env,
+    load_config,
+    remove_feed,
+    setup_obsidian,
+)
 from hawaiidisco.i18n import get_lang, Lang
 
+# Frequently reused fixture payloads, pre-encoded
+_FEEDS_EMPTY = b"feeds: []\n"
+_THEME_NORD = b"theme: nord\nfeeds: []\n"
+
+_YLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _stdin(lines: list[str]) -> io.StringIO:
+    """Return an in-memory stdin that answers successive ``input()`` prompts with *lines*."""
+    return io.StringIO("\n".join(lines) + "\n")
+
+
+def _write_config(path: Path, text: str | bytes) -> Config:
+    """Write *text* as config.yml at *path* and load it."""
+    path.write_bytes(text.encode() if isinstance(text, str) else text)
+    return load_config(path)
+
+
+def _load(path: Path) -> dict:
+    """Parse a YAML file written by the code under test."""
+    return yaml.load(path.read_bytes(), Loader=_YLoader)
+
 
 @pytest.fixture()
 def config_file(tmp_path: Path) -> Path:
@@ -19,55 +51,38 @@ def config_file(tmp_path: Path) -> Path:
 class TestLoadConfig:
     """Tests for the load_config function."""
 
-    def test_default_language_is_en(self, config_file: Path) -> None:
+    def test_default_language_is_en(self, default_config: Config) -> None:
         """Default language is 'en' when not specified."""
-        config_file.write_text("feeds: []\n", encoding="utf-8")
-        config = load_config(config_file)
-        assert config.language == "en"
+        assert default_config.language == "en"
 
     def test_language_ko(self, config_file: Path) -> None:
         """Korean language setting is loaded with language: ko."""
-        config_file.write_text("language: ko\nfeeds: []\n", encoding="utf-8")
-        config = load_config(config_file)
+        config = _write_config(config_file, "language: ko\nfeeds: []\n")
         assert config.language == "ko"
         assert get_lang() == Lang.KO
-        # restore
-        from hawaiidisco.i18n import set_lang
-        set_lang("en")
 
-    def test_ai_config_defaults(self, config_file: Path) -> None:
+    def test_ai_config_defaults(self, default_config: Config) -> None:
         """Use default values when AI config is absent."""
-        config_file.write_text("feeds: []\n", encoding="utf-8")
-        config = load_config(config_file)
-        assert config.ai.provider == "claude_cli"
-        assert config.ai.api_key == ""
-        assert config.ai.model == ""
+        assert default_config.ai.provider == "claude_cli"
+        assert default_config.ai.api_key == ""
+        assert default_config.ai.model == ""
 
     def test_ai_config_custom(self, config_file: Path) -> None:
         """Load custom AI configuration."""
-        data = {
-            "ai": {
-                "provider": "anthropic",
-                "api_key": "sk-test-123",
-                "model": "claude-3-opus",
-            },
-            "feeds": [],
-        }
-        config_file.write_text(yaml.dump(data), encoding="utf-8")
-        config = load_config(config_file)
+        config = _write_config(
+            config_file,
+            "ai:\n  provider: anthropic\n  api_key: sk-test-123\n  model: claude-3-opus\nfeeds: []\n",
+        )
         assert config.ai.provider == "anthropic"
         assert config.ai.api_key == "sk-test-123"
         assert config.ai.model == "claude-3-opus"
 
     def test_feeds_loading(self, config_file: Path) -> None:
         """Feed list is loaded correctly."""
-        data = {
-            "feeds": [
-                {"url": "https://example.com/feed", "name": "Test"},
-            ],
-        }
-        config_file.write_text(yaml.dump(data), encoding="utf-8")
-        config = load_config(config_file)
+        config = _write_config(
+            config_file,
+            "feeds:\n- url: https://example.com/feed\n  name: Test\n",
+        )
         assert len(config.feeds) == 1
         assert config.feeds[0].url == "https://example.com/feed"
         assert config.feeds[0].name == "Test"
@@ -80,38 +95,71 @@ class TestLoadConfig:
         assert config.refresh_interval == 30
 
 
+class TestParseCache:
+    """Tests for the parsed-config cache used by load_config."""
+
+    def test_unchanged_file_skips_parse(self, config_file: Path, monkeypatch) -> None:
+        """Reloading an unchanged file does not re-run the YAML parser."""
+        _clear_parse_cache()
+        config_file.write_bytes(_THEME_NORD)
+        assert load_config(config_file).theme == "nord"
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("YAML parsed again")
+
+        monkeypatch.setattr("hawaiidisco.config.yaml.load", _fail)
+        assert load_config(config_file).theme == "nord"
+
+    def test_modified_file_is_reparsed(self, config_file: Path) -> None:
+        """Changing the file contents invalidates the cached parse."""
+        config_file.write_bytes(_THEME_NORD)
+        assert load_config(config_file).theme == "nord"
+        config_file.write_text("theme: dracula\nfeeds: []\n", encoding="utf-8")
+        assert load_config(config_file).theme == "dracula"
+
+    def test_same_size_rewrite_with_new_mtime_is_reparsed(self, config_file: Path) -> None:
+        """A rewrite of the same size is picked up once the mtime moves."""
+        config_file.write_bytes(b"theme: aaaa\nfeeds: []\n")
+        assert load_config(config_file).theme == "aaaa"
+        mtime_ns = config_file.stat().st_mtime_ns
+        config_file.write_bytes(b"theme: bbbb\nfeeds: []\n")
+        os.utime(config_file, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+        assert load_config(config_file).theme == "bbbb"
+
+    def test_trivial_document_skips_parser(self, config_file: Path, monkeypatch) -> None:
+        """A bare ``feeds: []`` file is recognised without invoking the YAML parser."""
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("YAML parser invoked")
+
+        monkeypatch.setattr("hawaiidisco.config.yaml.load", _fail)
+        config_file.write_bytes(b"feeds: []\n\n")
+        config = load_config(config_file)
+        assert config.feeds == []
+        assert config.language == "en"
+
+
 class TestThemeConfig:
     """Tests for theme configuration."""
 
-    def test_default_theme(self, config_file: Path) -> None:
+    def test_default_theme(self, default_config: Config) -> None:
         """Default theme is textual-dark."""
-        config_file.write_text("feeds: []\n", encoding="utf-8")
-        config = load_config(config_file)
-        assert config.theme == "textual-dark"
+        assert default_config.theme == "textual-dark"
 
     def test_custom_theme(self, config_file: Path) -> None:
         """Custom theme can be loaded."""
-        data = {"theme": "nord", "feeds": []}
-        config_file.write_text(yaml.dump(data), encoding="utf-8")
-        config = load_config(config_file)
+        config = _write_config(config_file, _THEME_NORD)
         assert config.theme == "nord"
 
     def test_theme_from_full_config(self, config_file: Path) -> None:
         """Theme can be read from full config."""
-        data = {
-            "language": "ko",
-            "theme": "dracula",
-            "feeds": [],
-            "refresh_interval": 15,
-        }
-        config_file.write_text(yaml.dump(data), encoding="utf-8")
-        config = load_config(config_file)
+        config = _write_config(
+            config_file,
+            "language: ko\ntheme: dracula\nfeeds: []\nrefresh_interval: 15\n",
+        )
         assert config.theme == "dracula"
         assert config.language == "ko"
         assert config.refresh_interval == 15
-        # restore
-        from hawaiidisco.i18n import set_lang
-        set_lang("en")
 
 
 class TestResolveEnv:
@@ -134,48 +182,45 @@ class TestResolveEnv:
         """Empty string is returned unchanged."""
         assert _resolve_env("") == ""
 
+    def test_embedded_pattern_unchanged(self, monkeypatch) -> None:
+        """Only a whole-value ${ENV_VAR} is substituted; embedded patterns are left as-is."""
+        monkeypatch.setenv("TEST_API_KEY", "my-secret-key")
+        assert _resolve_env("prefix-${TEST_API_KEY}") == "prefix-${TEST_API_KEY}"
+        assert _resolve_env("${TEST_API_KEY}-suffix") == "${TEST_API_KEY}-suffix"
+
     def test_env_var_in_config(self, config_file: Path, monkeypatch) -> None:
         """Load API key from config.yml using ${ENV_VAR} pattern."""
         monkeypatch.setenv("MY_API_KEY", "resolved-key")
-        data = {
-            "ai": {
-                "provider": "anthropic",
-                "api_key": "${MY_API_KEY}",
-            },
-            "feeds": [],
-        }
-        config_file.write_text(yaml.dump(data), encoding="utf-8")
-        config = load_config(config_file)
+        config = _write_config(
+            config_file,
+            "ai:\n  provider: anthropic\n  api_key: ${MY_API_KEY}\nfeeds: []\n",
+        )
         assert config.ai.api_key == "resolved-key"
 
 
 class TestObsidianConfig:
     """Tests for Obsidian configuration loading."""
 
-    def test_default_obsidian_disabled(self, config_file: Path) -> None:
+    def test_default_obsidian_disabled(self, default_config: Config) -> None:
         """Obsidian is disabled by default when not in config."""
-        config_file.write_text("feeds: []\n", encoding="utf-8")
-        config = load_config(config_file)
-        assert config.obsidian.enabled is False
-        assert config.obsidian.vault_path == Path("")
+        assert default_config.obsidian.enabled is False
+        assert default_config.obsidian.vault_path == Path("")
 
     def test_obsidian_config_loading(self, config_file: Path) -> None:
         """Full obsidian config is parsed correctly."""
-        data = {
-            "feeds": [],
-            "obsidian": {
-                "enabled": True,
-                "vault_path": "/tmp/test-vault",
-                "folder": "my-notes",
-                "template": "minimal",
-                "auto_save": False,
-                "include_insight": False,
-                "include_translation": True,
-                "tags_prefix": "hd",
-            },
-        }
-        config_file.write_text(yaml.dump(data), encoding="utf-8")
-        config = load_config(config_file)
+        config = _write_config(
+            config_file,
+            "feeds: []\n"
+            "obsidian:\n"
+            "  enabled: true\n"
+            "  vault_path: /tmp/test-vault\n"
+            "  folder: my-notes\n"
+            "  template: minimal\n"
+            "  auto_save: false\n"
+            "  include_insight: false\n"
+            "  include_translation: true\n"
+            "  tags_prefix: hd\n",
+        )
         assert config.obsidian.enabled is True
         assert config.obsidian.vault_path == Path("/tmp/test-vault")
         assert config.obsidian.folder == "my-notes"
@@ -187,28 +232,18 @@ class TestObsidianConfig:
 
     def test_obsidian_vault_path_expanduser(self, config_file: Path) -> None:
         """vault_path with ~ is expanded."""
-        data = {
-            "feeds": [],
-            "obsidian": {
-                "enabled": True,
-                "vault_path": "~/Documents/Vault",
-            },
-        }
-        config_file.write_text(yaml.dump(data), encoding="utf-8")
-        config = load_config(config_file)
+        config = _write_config(
+            config_file,
+            "feeds: []\nobsidian:\n  enabled: true\n  vault_path: ~/Documents/Vault\n",
+        )
         assert "~" not in str(config.obsidian.vault_path)
 
     def test_obsidian_defaults_when_partial(self, config_file: Path) -> None:
         """Missing obsidian fields use defaults."""
-        data = {
-            "feeds": [],
-            "obsidian": {
-                "enabled": True,
-                "vault_path": "/tmp/vault",
-            },
-        }
-        config_file.write_text(yaml.dump(data), encoding="utf-8")
-        config = load_config(config_file)
+        config = _write_config(
+            config_file,
+            "feeds: []\nobsidian:\n  enabled: true\n  vault_path: /tmp/vault\n",
+        )
         assert config.obsidian.folder == "hawaii-disco"
         assert config.obsidian.auto_save is True
         assert config.obsidian.tags_prefix == "hawaiidisco"
@@ -220,34 +255,71 @@ class TestRemoveFeed:
     def test_remove_existing_feed(self, tmp_path: Path, monkeypatch) -> None:
         """Removing an existing feed returns True."""
         config_path = tmp_path / "config.yml"
-        data = {
-            "feeds": [
-                {"url": "https://a.com/feed", "name": "Feed A"},
-                {"url": "https://b.com/feed", "name": "Feed B"},
-            ]
-        }
-        config_path.write_text(yaml.dump(data), encoding="utf-8")
+        config_path.write_text(
+            "feeds:\n"
+            "- url: https://a.com/feed\n  name: Feed A\n"
+            "- url: https://b.com/feed\n  name: Feed B\n",
+            encoding="utf-8",
+        )
         monkeypatch.setattr("hawaiidisco.config.CONFIG_PATH", config_path)
 
         result = remove_feed("https://a.com/feed")
         assert result is True
 
         # Verify the feed was removed from the file
-        with open(config_path, encoding="utf-8") as f:
-            updated = yaml.safe_load(f)
+        updated = _load(config_path)
         assert len(updated["feeds"]) == 1
         assert updated["feeds"][0]["url"] == "https://b.com/feed"
 
     def test_remove_nonexistent_feed(self, tmp_path: Path, monkeypatch) -> None:
         """Removing a non-existent feed returns False."""
         config_path = tmp_path / "config.yml"
-        data = {"feeds": [{"url": "https://a.com/feed", "name": "Feed A"}]}
-        config_path.write_text(yaml.dump(data), encoding="utf-8")
+        config_path.write_text("feeds:\n- url: https://a.com/feed\n  name: Feed A\n", encoding="utf-8")
         monkeypatch.setattr("hawaiidisco.config.CONFIG_PATH", config_path)
 
         result = remove_feed("https://nonexistent.com/feed")
         assert result is False
 
+    def test_remove_item_with_blank_line(self, tmp_path: Path, monkeypatch) -> None:
+        """Keys after a blank line inside the removed item go with it, not onto the previous feed."""
+        config_path = tmp_path / "config.yml"
+        config_path.write_text(
+            "feeds:\n"
+            "- url: https://a.com/feed\n  name: Feed A\n"
+            "- url: https://b.com/feed\n\n  name: Feed B\n"
+            "- url: https://c.com/feed\n  name: Feed C\n",
+            encoding="utf-8",
+        )
+        monkeypatch.setattr("hawaiidisco.config.CONFIG_PATH", config_path)
+
+        assert remove_feed("https://b.com/feed") is True
+        assert _load(config_path)["feeds"] == [
+            {"url": "https://a.com/feed", "name": "Feed A"},
+            {"url": "https://c.com/feed", "name": "Feed C"},
+        ]
+
+    def test_remove_last_feed_leaves_empty_list(self, tmp_path: Path, monkeypatch) -> None:
+        """Removing the only feed still yields a valid empty list."""
+        config_path = tmp_path / "config.yml"
+        config_path.write_text("feeds:\n- url: https://a.com/feed\n  name: Feed A\n", encoding="utf-8")
+        monkeypatch.setattr("hawaiidisco.config.CONFIG_PATH", config_path)
+
+        assert remove_feed("https://a.com/feed") is True
+        assert _load(config_path)["feeds"] == []
+
+    def test_url_outside_feeds_not_removed(self, tmp_path: Path, monkeypatch) -> None:
+        """A matching ``- url:`` line under another key is left alone."""
+        config_path = tmp_path / "config.yml"
+        config_path.write_text(
+            "feeds:\n- url: https://b.com/feed\n  name: Feed B\n"
+            "other:\n- url: https://a.com/feed\n",
+            encoding="utf-8",
+        )
+        monkeypatch.setattr("hawaiidisco.config.CONFIG_PATH", config_path)
+
+        assert remove_feed("https://a.com/feed") is False
+        assert _load(config_path)["other"] == [{"url": "https://a.com/feed"}]
+
 
 class TestPromptYn:
     """Tests for the _prompt_yn helper."""
@@ -282,13 +354,11 @@ class TestSetupObsidian:
         vault.mkdir()
 
         # vault_path, folder(default), auto_save(Y), insight(Y), translation(Y), tags(default)
-        inputs = iter([str(vault), "", "", "", "", ""])
-        monkeypatch.setattr("builtins.input", lambda prompt="": next(inputs))
+        monkeypatch.setattr("sys.stdin", _stdin([str(vault), "", "", "", "", ""]))
 
         setup_obsidian()
 
-        with open(config_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _load(config_path)
 
         assert data["obsidian"]["enabled"] is True
         assert data["obsidian"]["vault_path"] == str(vault)
@@ -298,20 +368,18 @@ class TestSetupObsidian:
     def test_invalid_path_retries(self, tmp_path: Path, monkeypatch) -> None:
         """setup_obsidian retries when vault path does not exist."""
         config_path = tmp_path / "config.yml"
-        config_path.write_text("feeds: []\n", encoding="utf-8")
+        config_path.write_bytes(_FEEDS_EMPTY)
         monkeypatch.setattr("hawaiidisco.config.CONFIG_PATH", config_path)
 
         vault = tmp_path / "real-vault"
         vault.mkdir()
 
         # First input is invalid, second is valid
-        inputs = iter(["/nonexistent/path", str(vault), "", "", "", "", ""])
-        monkeypatch.setattr("builtins.input", lambda prompt="": next(inputs))
+        monkeypatch.setattr("sys.stdin", _stdin(["/nonexistent/path", str(vault), "", "", "", "", ""]))
 
         setup_obsidian()
 
-        with open(config_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _load(config_path)
         assert data["obsidian"]["enabled"] is True
         assert data["obsidian"]["vault_path"] == str(vault)
 
@@ -327,38 +395,30 @@ class TestSetupObsidian:
         vault = tmp_path / "vault"
         vault.mkdir()
 
-        inputs = iter([str(vault), "", "", "", "", ""])
-        monkeypatch.setattr("builtins.input", lambda prompt="": next(inputs))
+        monkeypatch.setattr("sys.stdin", _stdin([str(vault), "", "", "", "", ""]))
 
         setup_obsidian()
 
-        with open(config_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _load(config_path)
         assert data["language"] == "ko"
         assert len(data["feeds"]) == 1
         assert data["obsidian"]["enabled"] is True
 
-        # restore
-        from hawaiidisco.i18n import set_lang
-        set_lang("en")
-
     def test_custom_values(self, tmp_path: Path, monkeypatch) -> None:
         """setup_obsidian saves custom user inputs."""
         config_path = tmp_path / "config.yml"
-        config_path.write_text("feeds: []\n", encoding="utf-8")
+        config_path.write_bytes(_FEEDS_EMPTY)
         monkeypatch.setattr("hawaiidisco.config.CONFIG_PATH", config_path)
 
         vault = tmp_path / "vault"
         vault.mkdir()
 
         # vault, folder=notes, auto_save=n, insight=n, translation=y, tags=hd
-        inputs = iter([str(vault), "notes", "n", "n", "y", "hd"])
-        monkeypatch.setattr("builtins.input", lambda prompt="": next(inputs))
+        monkeypatch.setattr("sys.stdin", _stdin([str(vault), "notes", "n", "n", "y", "hd"]))
 
         setup_obsidian()
 
-        with open(config_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _load(config_path)
         assert data["obsidian"]["folder"] == "notes"
         assert data["obsidian"]["auto_save"] is False
         assert data["obsidian"]["include_insight"] is False
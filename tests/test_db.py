@@ -1,18 +1,38 @@
 """Tests for Database thread safety and translated_body."""
 from __future__ import annotations
 
+import sqlite3
 import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
-from hawaiidisco.db import Database
+from hawaiidisco.db import _SQL_RECENT_BOOKMARKS, SCHEMA_SQL, Database
+
+
+@pytest.fixture(scope="session")
+def _template_db() -> Database:
+    """Build the migrated schema once, in memory."""
+    return Database(Path(":memory:"))
 
 
 @pytest.fixture()
-def db(tmp_path: Path) -> Database:
-    """Create a temporary DB instance."""
-    return Database(tmp_path / "test.db")
+def db(tmp_path: Path, _template_db: Database) -> Iterator[Database]:
+    """Create a temporary DB instance by copying the migrated template.
+
+    The copy carries the schema version, so opening it skips migration. It stays
+    file-backed so the pool and WAL behave as in the app.
+    """
+    path = tmp_path / "test.db"
+    target = sqlite3.connect(path)
+    with _template_db._conn() as conn:
+        conn.backup(target)
+    target.close()
+    database = Database(path)
+    yield database
+    database.close()
 
 
 def _insert_sample(db: Database, article_id: str = "test-1") -> None:
@@ -76,41 +96,137 @@ class TestThreadSafety:
         assert article is not None
         assert article.title == "Test Article"
 
-    def test_concurrent_read_write(self, db: Database) -> None:
+    def test_concurrent_read_write(self, db: Database, executor: ThreadPoolExecutor) -> None:
         """No errors when multiple threads perform concurrent reads and writes."""
-        errors: list[Exception] = []
         count = 20
 
         def writer(i: int) -> None:
-            try:
-                db.upsert_article(
-                    article_id=f"concurrent-{i}",
-                    feed_name="TestFeed",
-                    title=f"Article {i}",
-                    link=f"https://example.com/{i}",
-                    description=None,
-                    published_at=None,
-                )
-            except Exception as e:
-                errors.append(e)
-
-        def reader() -> None:
-            try:
-                db.get_articles()
-            except Exception as e:
-                errors.append(e)
-
-        threads = []
-        for i in range(count):
-            threads.append(threading.Thread(target=writer, args=(i,)))
-            threads.append(threading.Thread(target=reader))
+            db.upsert_article(
+                article_id=f"concurrent-{i}",
+                feed_name="TestFeed",
+                title=f"Article {i}",
+                link=f"https://example.com/{i}",
+                description=None,
+                published_at=None,
+            )
+
+        futs = [executor.submit(writer, i) for i in range(count)]
+        futs += [executor.submit(db.get_articles) for _ in range(count)]
+        for f in futs:
+            f.result()
+
+        assert len(db.get_articles()) == count
+
+    def test_connections_bounded_by_pool(self, db: Database, executor: ThreadPoolExecutor) -> None:
+        """Connections are reused instead of opened per thread."""
+        for f in [executor.submit(db.get_articles) for _ in range(10)]:
+            f.result()
+
+        assert db._opened <= db._pool_size
+
+    def test_memory_db_shared_across_threads(self) -> None:
+        """An in-memory DB is the same database from every thread."""
+        db = Database(Path(":memory:"))
+        t = threading.Thread(target=_insert_sample, args=(db,))
+        t.start()
+        t.join()
+        assert db.get_article("test-1") is not None
+
+
+class TestUpsertArticles:
+    """Tests for the batched upsert_articles API."""
+
+    def test_inserts_all_rows(self, db: Database) -> None:
+        rows = [(f"b-{i}", "Feed", f"Title {i}", f"https://x.com/{i}", None, None) for i in range(5)]
+        assert db.upsert_articles(rows) == 5
+        assert len(db.get_articles()) == 5
+
+    def test_existing_ids_ignored(self, db: Database) -> None:
+        """Existing articles are left untouched and not counted as new."""
+        _insert_sample(db, "b-1")
+        db.set_insight("b-1", "kept")
+        rows = [
+            ("b-1", "Feed", "Changed", "https://x.com/1", None, None),
+            ("b-2", "Feed", "New", "https://x.com/2", None, None),
+        ]
+        assert db.upsert_articles(rows) == 1
+        article = db.get_article("b-1")
+        assert article is not None
+        assert article.title == "Test Article"
+        assert article.insight == "kept"
+
+    def test_empty_batch(self, db: Database) -> None:
+        assert db.upsert_articles([]) == 0
+
+    def test_concurrent_batches(self, db: Database, executor: ThreadPoolExecutor) -> None:
+        """Multi-row batches from several threads all land, each counted once."""
+        batches = [
+            [(f"cb-{b}-{i}", f"Feed {b}", f"Title {i}", f"https://x.com/{b}/{i}", None, None) for i in range(10)]
+            for b in range(4)
+        ]
+        futs = [executor.submit(db.upsert_articles, rows) for rows in batches]
+        futs += [executor.submit(db.get_articles) for _ in range(4)]
+        assert [f.result() for f in futs[:4]] == [10, 10, 10, 10]
+        assert len(db.get_articles()) == 40
+
+
+class TestConnectionPragmas:
+    """Pooled connections are opened with the tuning PRAGMAs."""
+
+    def test_file_db_pragmas(self, db: Database) -> None:
+        with db._conn() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+
+class TestWriteTransaction:
+    """Tests for the BEGIN IMMEDIATE write helper."""
+
+    def test_commits_on_success(self, db: Database) -> None:
+        with db._write_tx() as conn:
+            conn.execute("INSERT INTO articles (id, feed_name, title, link) VALUES ('w-1', 'F', 'T', 'L')")
+        assert db.get_article("w-1") is not None
+
+    def test_rolls_back_on_error(self, db: Database) -> None:
+        """An exception inside the block discards the transaction."""
+        with pytest.raises(RuntimeError):
+            with db._write_tx() as conn:
+                conn.execute("INSERT INTO articles (id, feed_name, title, link) VALUES ('w-2', 'F', 'T', 'L')")
+                raise RuntimeError("boom")
+        assert db.get_article("w-2") is None
+        with db._conn() as conn:
+            assert not conn.in_transaction
+
+    def test_reentrant_borrow_fails_loudly(self, monkeypatch) -> None:
+        """Borrowing again while holding the only pooled connection raises instead of hanging."""
+        monkeypatch.setattr("hawaiidisco.db._POOL_TIMEOUT", 0.05)
+        database = Database(Path(":memory:"))
+        with database._write_tx():
+            with pytest.raises(RuntimeError, match="re-entrantly"):
+                with database._conn():
+                    pass
+        # The outer connection went back to the pool and is usable again
+        assert database.get_article("missing") is None
+        database.close()
+
+
+class TestClose:
+    """Tests for Database.close."""
+
+    def test_close_drains_pool(self, db: Database) -> None:
+        _insert_sample(db)
+        db.close()
+        assert db._opened == 0
+        assert db._pool.empty()
 
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+    def test_usable_after_close(self, db: Database) -> None:
+        """A closed Database reopens connections on demand."""
+        _insert_sample(db)
+        db.close()
+        assert db.get_article("test-1") is not None
 
-        assert not errors, f"Concurrent access error: {errors}"
 
 class TestTranslatedBody:
     """Tests for translated_body column migration and CRUD."""
@@ -118,11 +234,22 @@ class TestTranslatedBody:
     def test_migration_adds_translated_body_column(self, tmp_path: Path) -> None:
         """Migration adds the translated_body column."""
         db = Database(tmp_path / "migrate.db")
-        conn = db._get_conn()
-        cursor = conn.execute("PRAGMA table_info(articles)")
-        columns = {row[1] for row in cursor.fetchall()}
+        with db._conn() as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(articles)").fetchall()}
         assert "translated_body" in columns
 
+    def test_migrated_db_skips_migration(self, tmp_path: Path, monkeypatch) -> None:
+        """Reopening an up-to-date database does not re-run the migration checks."""
+        Database(tmp_path / "migrate.db").close()
+
+        def _fail(self, conn) -> None:
+            raise AssertionError("migration re-ran")
+
+        monkeypatch.setattr(Database, "_migrate", _fail)
+        db = Database(tmp_path / "migrate.db")
+        with db._conn() as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] >= 1
+
     def test_new_article_has_null_translated_body(self, db: Database) -> None:
         """New article's translated_body is None."""
         _insert_sample(db)
@@ -201,6 +328,34 @@ class TestArticleCountByFeed:
         result = db.get_article_count_by_feed()
         assert result == {"Feed A": 2, "Feed B": 1}
 
+    def test_duplicate_insert_not_counted(self, db: Database) -> None:
+        """An ignored re-insert of an existing ID leaves the count unchanged."""
+        _insert_sample(db, "a-1")
+        _insert_sample(db, "a-1")
+        assert db.get_article_count_by_feed() == {"TestFeed": 1}
+
+    def test_delete_feed_drops_count(self, db: Database) -> None:
+        """Deleting a feed's articles removes its entry."""
+        db.upsert_article("a-1", "Feed A", "Article 1", "https://a.com/1", None, None)
+        db.upsert_article("b-1", "Feed B", "Article 2", "https://b.com/1", None, None)
+        db.delete_articles_by_feed("Feed A")
+        assert db.get_article_count_by_feed() == {"Feed B": 1}
+
+    def test_counts_backfilled_on_migration(self, tmp_path: Path) -> None:
+        """Articles stored before the counts table existed are counted after migration."""
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.executescript(SCHEMA_SQL)
+        conn.executemany(
+            "INSERT INTO articles (id, feed_name, title, link) VALUES (?, ?, ?, ?)",
+            [("a-1", "Feed A", "T", "L"), ("a-2", "Feed A", "T", "L"), ("b-1", "Feed B", "T", "L")],
+        )
+        conn.commit()
+        conn.close()
+        db = Database(db_path)
+        assert db.get_article_count_by_feed() == {"Feed A": 2, "Feed B": 1}
+        db.close()
+
 
 class TestDeleteArticlesByFeed:
     """Tests for delete_articles_by_feed."""
@@ -231,6 +386,24 @@ class TestDeleteArticlesByFeed:
         deleted = db.delete_articles_by_feed("Nonexistent")
         assert deleted == 0
 
+    def test_legacy_bookmarks_gain_cascade(self, tmp_path: Path) -> None:
+        """Bookmarks from a pre-cascade schema are kept on upgrade and then cascade on delete."""
+        path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(path)
+        conn.executescript(SCHEMA_SQL.replace(" ON DELETE CASCADE", ""))
+        conn.execute("INSERT INTO articles (id, feed_name, title, link) VALUES ('old-1', 'F', 'T', 'L')")
+        conn.execute("INSERT INTO bookmarks (id, article_id, memo) VALUES (7, 'old-1', 'memo')")
+        conn.commit()
+        conn.close()
+
+        db = Database(path)
+        assert db.get_bookmark_memo("old-1") == "memo"
+        with db._conn() as conn:
+            assert conn.execute("SELECT id FROM bookmarks").fetchone()[0] == 7
+        db.delete_articles_by_feed("F")
+        assert db.get_bookmark_memo("old-1") is None
+        db.close()
+
 
 class TestFeedNameFilter:
     """Tests for get_articles feed_name filter."""
@@ -328,6 +501,94 @@ class TestUnreadFilter:
         assert results == []
 
 
+class TestFullTextSearch:
+    """Tests for the trigram FTS index behind get_articles(search=...)."""
+
+    def test_substring_match(self, db: Database) -> None:
+        """Substrings (including inside Korean words) match, case-insensitively."""
+        db.upsert_article("s-1", "Feed", "파이썬의 세계", "https://x.com/1", "Intro to PYTHON", None)
+        db.upsert_article("s-2", "Feed", "Rust", "https://x.com/2", None, None)
+        assert [a.id for a in db.get_articles(search="파이썬")] == ["s-1"]
+        assert [a.id for a in db.get_articles(search="ython")] == ["s-1"]
+
+    def test_index_follows_updates_and_deletes(self, db: Database) -> None:
+        _insert_sample(db, "s-3")
+        db.set_insight("s-3", "quantum leap")
+        assert [a.id for a in db.get_articles(search="quantum")] == ["s-3"]
+        db.set_insight("s-3", "something else")
+        assert db.get_articles(search="quantum") == []
+        db.delete_articles_by_feed("TestFeed")
+        assert db.get_articles(search="something") == []
+
+    def test_quotes_in_search(self, db: Database) -> None:
+        """Double quotes are matched literally rather than parsed as FTS syntax."""
+        db.upsert_article("s-4", "Feed", 'The "best" tool', "https://x.com/4", None, None)
+        assert [a.id for a in db.get_articles(search='"best"')] == ["s-4"]
+
+    def test_like_fallback_without_fts(self, db: Database) -> None:
+        """Search still works through LIKE when the index is unavailable."""
+        db.upsert_article("s-5", "Feed", "Python Tips", "https://x.com/5", None, None)
+        db._fts = False
+        assert [a.id for a in db.get_articles(search="python")] == ["s-5"]
+
+    def test_short_search_matches_inside_words(self, db: Database) -> None:
+        """Queries too short for the trigram index still match mid-word, not just as a prefix."""
+        db.upsert_article("s-6", "Feed", "Python Tips", "https://x.com/6", None, None)
+        db.upsert_article("s-7", "Feed", "Rust", "https://x.com/7", None, None)
+        assert [a.id for a in db.get_articles(search="TH")] == ["s-6"]
+
+    def test_search_survives_vacuum(self, db: Database) -> None:
+        """The index is keyed on articles.seq, so VACUUM cannot point it at the wrong rows."""
+        for i in range(6):
+            db.upsert_article(f"v-{i}", f"Feed {i % 2}", f"Vacuum title {i}", f"https://x.com/{i}", None, None)
+        db.delete_articles_by_feed("Feed 0")
+        with db._conn() as conn:
+            conn.execute("VACUUM")
+            conn.execute("INSERT INTO articles_fts(articles_fts) VALUES ('integrity-check')")
+        assert [a.id for a in db.get_articles(search="title 3")] == ["v-3"]
+        assert {a.id for a in db.get_articles(search="vacuum")} == {"v-1", "v-3", "v-5"}
+
+    def test_implicit_rowid_articles_rebuilt(self, tmp_path: Path) -> None:
+        """A TEXT-keyed articles table gains seq on upgrade, keeping bookmarks and search."""
+        path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            SCHEMA_SQL.replace(
+                "    seq INTEGER PRIMARY KEY,  -- explicit rowid: VACUUM keeps it, so the FTS index can key on it\n"
+                "    id TEXT NOT NULL UNIQUE,",
+                "    id TEXT PRIMARY KEY,",
+            )
+        )
+        conn.execute("INSERT INTO articles (id, feed_name, title, link) VALUES ('old-1', 'F', 'Legacy Title', 'L')")
+        conn.execute("INSERT INTO bookmarks (article_id, memo) VALUES ('old-1', 'memo')")
+        conn.commit()
+        conn.close()
+
+        db = Database(path)
+        with db._conn() as conn:
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(articles)")]
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        assert columns[:2] == ["seq", "id"]
+        assert db.get_bookmark_memo("old-1") == "memo"
+        assert [a.id for a in db.get_articles(search="legacy")] == ["old-1"]
+        assert db.get_article_count_by_feed() == {"F": 1}
+        db.close()
+
+    def test_existing_articles_indexed_on_migration(self, tmp_path: Path) -> None:
+        """Articles stored before the index existed are searchable after upgrade."""
+        path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(path)
+        conn.executescript(SCHEMA_SQL)
+        conn.execute(
+            "INSERT INTO articles (id, feed_name, title, link) VALUES ('old-1', 'F', 'Legacy Title', 'https://x.com')"
+        )
+        conn.commit()
+        conn.close()
+
+        db = Database(path)
+        assert [a.id for a in db.get_articles(search="legacy")] == ["old-1"]
+
+
 class TestGetAllBookmarkMemos:
     """Tests for retrieving all bookmark memos."""
 
@@ -463,6 +724,72 @@ class TestBookmarkTags:
         result = db.get_all_bookmark_tags()
         assert result == {"tag-e1": ["ai", "ml"]}
 
+    def test_get_all_bookmark_tags_keeps_order(self, db: Database) -> None:
+        """Tags come back in the order they were set, not sorted."""
+        _insert_sample(db, "tag-e3")
+        db.toggle_bookmark("tag-e3")
+        db.set_bookmark_tags("tag-e3", ["zeta", "alpha", "mid"])
+
+        assert db.get_all_bookmark_tags() == {"tag-e3": ["zeta", "alpha", "mid"]}
+
+    def test_unbookmark_clears_tags(self, db: Database) -> None:
+        """Removing a bookmark also removes its tags."""
+        _insert_sample(db, "tag-f1")
+        db.toggle_bookmark("tag-f1")
+        db.set_bookmark_tags("tag-f1", ["ai"])
+        db.toggle_bookmark("tag-f1")
+        assert db.get_all_tags() == []
+        assert db.get_articles_by_tag("ai") == []
+
+    def test_tags_ignored_without_bookmark(self, db: Database) -> None:
+        """Tags cannot be attached to an article that is not bookmarked."""
+        _insert_sample(db, "tag-g1")
+        db.set_bookmark_tags("tag-g1", ["ai"])
+        assert db.get_bookmark_tags("tag-g1") == []
+
+    def test_migrates_legacy_csv_tags(self, tmp_path: Path) -> None:
+        """Comma-separated tags from older databases are moved into bookmark_tags."""
+        path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(path)
+        conn.executescript(SCHEMA_SQL)
+        conn.execute(
+            "INSERT INTO articles (id, feed_name, title, link) VALUES ('old-1', 'F', 'T', 'https://x.com')"
+        )
+        conn.execute("UPDATE articles SET is_bookmarked = 1")
+        conn.execute("INSERT INTO bookmarks (article_id, tags) VALUES ('old-1', 'rust, tech,')")
+        conn.commit()
+        conn.close()
+
+        db = Database(path)
+        assert db.get_bookmark_tags("old-1") == ["rust", "tech"]
+        assert [a.id for a in db.get_articles_by_tag("tech")] == ["old-1"]
+
+    def test_rowid_tag_table_rebuilt(self, tmp_path: Path) -> None:
+        """A rowid-backed bookmark_tags table is rebuilt WITHOUT ROWID, keeping its rows."""
+        path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(path)
+        conn.executescript(SCHEMA_SQL)
+        conn.execute(
+            "INSERT INTO articles (id, feed_name, title, link) VALUES ('old-1', 'F', 'T', 'https://x.com')"
+        )
+        conn.execute("INSERT INTO bookmarks (article_id) VALUES ('old-1')")
+        conn.execute(
+            "CREATE TABLE bookmark_tags (article_id TEXT NOT NULL, tag TEXT NOT NULL, "
+            "position INTEGER NOT NULL, PRIMARY KEY (article_id, tag))"
+        )
+        conn.executemany(
+            "INSERT INTO bookmark_tags VALUES ('old-1', ?, ?)", [("zeta", 0), ("alpha", 1)]
+        )
+        conn.commit()
+        conn.close()
+
+        db = Database(path)
+        assert db.get_bookmark_tags("old-1") == ["zeta", "alpha"]
+        with db._conn() as conn:
+            sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'bookmark_tags'").fetchone()[0]
+        assert "WITHOUT ROWID" in sql
+        db.close()
+
 
 class TestGetRecentBookmarkedArticles:
     """Tests for querying recently bookmarked articles."""
@@ -488,14 +815,24 @@ class TestGetRecentBookmarkedArticles:
 
     def test_multiple_bookmarks_ordered_desc(self, db: Database) -> None:
         """Multiple bookmarks are returned in descending order."""
+        db.upsert_articles(
+            (f"r-{i}", "TestFeed", "Test Article", "https://example.com", "desc", None) for i in range(3)
+        )
         for i in range(3):
-            _insert_sample(db, f"r-{i}")
             db.toggle_bookmark(f"r-{i}")
         result = db.get_recent_bookmarked_articles(days=7)
         assert len(result) == 3
         # Last bookmarked item comes first
         assert result[0].id == "r-2"
 
+    def test_ordered_by_index(self, db: Database) -> None:
+        """The recent-bookmarks query is served in index order, without a temp sort."""
+        with db._conn() as conn:
+            plan = conn.execute(f"EXPLAIN QUERY PLAN {_SQL_RECENT_BOOKMARKS}", ("-7 days",)).fetchall()
+        details = " ".join(row[3] for row in plan)
+        assert "idx_bookmarks_recent" in details
+        assert "TEMP B-TREE" not in details
+
     def test_from_other_thread(self, db: Database) -> None:
         """Can be queried from another thread."""
         _insert_sample(db, "r-t")
@@ -517,6 +854,30 @@ class TestGetRecentBookmarkedArticles:
         assert len(results) == 1
 
 
+class TestToggleBookmark:
+    """Tests for toggle_bookmark."""
+
+    def test_toggle_nonexistent_returns_false(self, db: Database) -> None:
+        """A missing article is not bookmarked and leaves no bookmark row."""
+        assert db.toggle_bookmark("nonexistent") is False
+        with db._conn() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM bookmarks").fetchone()[0] == 0
+
+    def test_toggle_races_feed_delete(
+        self, db: Database, executor: ThreadPoolExecutor
+    ) -> None:
+        """Toggling while the article's feed is deleted never violates the foreign key."""
+        for i in range(20):
+            db.upsert_article(f"race-{i}", "Race", "T", "https://r.com", None, None)
+        toggles = [executor.submit(db.toggle_bookmark, f"race-{i}") for i in range(20)]
+        delete = executor.submit(db.delete_articles_by_feed, "Race")
+        for future in toggles:
+            future.result()
+        assert delete.result() == 20
+        with db._conn() as conn:
+            assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+
+
 class TestToggleRead:
     """Tests for toggle_read method."""
 
@@ -1,13 +1,20 @@
 """Unit tests for FeedListScreen, BookmarkListScreen, and BookmarkItem."""
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime
 
+import pytest
+
 from hawaiidisco.config import FeedConfig
 from hawaiidisco.db import Article
 from hawaiidisco.screens import FeedItem, FeedListScreen, BookmarkItem, BookmarkListScreen, TagItem
 
 
+# Timestamp used for both published_at and fetched_at in sample articles
+_DEFAULT_TS = datetime(2025, 1, 15, 10, 0)
+
+
 def _make_article(
     article_id: str = "test-1",
     title: str = "Test Article",
@@ -21,14 +28,20 @@ def _make_article(
         title=title,
         link=f"https://example.com/{article_id}",
         description="desc",
-        published_at=published_at or datetime(2025, 1, 15, 10, 0),
-        fetched_at=datetime(2025, 1, 15, 10, 0),
+        published_at=published_at or _DEFAULT_TS,
+        fetched_at=_DEFAULT_TS,
         is_read=False,
         is_bookmarked=True,
         insight=None,
     )
 
 
+@pytest.fixture(scope="module")
+def article() -> Article:
+    """Return a bookmarked article shared by the formatting tests. Treat as read-only."""
+    return _make_article()
+
+
 class TestFeedItem:
     """Tests for FeedItem formatting."""
 
@@ -36,7 +49,7 @@ class TestFeedItem:
         """Default format includes feed name, URL, and article count."""
         feed = FeedConfig(url="https://a.com/feed", name="Feed A")
         item = FeedItem(feed, count=10)
-        result = item._format()
+        result = item._format
         assert "Feed A" in result
         assert "https://a.com/feed" in result
         assert "10" in result
@@ -45,7 +58,7 @@ class TestFeedItem:
         """Formats correctly even when article count is zero."""
         feed = FeedConfig(url="https://new.com/feed", name="New Feed")
         item = FeedItem(feed, count=0)
-        result = item._format()
+        result = item._format
         assert "New Feed" in result
         assert "0" in result
 
@@ -73,51 +86,44 @@ class TestFeedListScreen:
 class TestBookmarkItem:
     """Tests for BookmarkItem formatting."""
 
-    def test_format_basic(self) -> None:
+    def test_format_basic(self, article: Article) -> None:
         """Basic format includes title, feed name, and date."""
-        article = _make_article()
         item = BookmarkItem(article)
-        result = item._format()
+        result = item._format
         assert "Test Article" in result
         assert "TestFeed" in result
         assert "2025-01-15" in result
 
-    def test_format_with_memo(self) -> None:
+    def test_format_with_memo(self, article: Article) -> None:
         """Show memo preview when memo is present."""
-        article = _make_article()
         item = BookmarkItem(article, memo="좋은 글이다")
-        result = item._format()
+        result = item._format
         assert "좋은 글이다" in result
 
-    def test_format_long_memo_truncated(self) -> None:
+    def test_format_long_memo_truncated(self, article: Article) -> None:
         """Long memo is truncated with ellipsis."""
-        article = _make_article()
         long_memo = "이것은 매우 긴 메모입니다. " * 10
         item = BookmarkItem(article, memo=long_memo)
-        result = item._format()
+        result = item._format
         assert "..." in result
 
-    def test_format_no_published_at(self) -> None:
+    def test_format_no_published_at(self, article: Article) -> None:
         """Use fetched_at when published_at is None."""
-        article = _make_article()
-        article.published_at = None
-        item = BookmarkItem(article)
-        result = item._format()
+        item = BookmarkItem(replace(article, published_at=None))
+        result = item._format
         assert "2025-01-15" in result
 
-    def test_format_with_tags(self) -> None:
+    def test_format_with_tags(self, article: Article) -> None:
         """Tags are displayed when present."""
-        article = _make_article()
         item = BookmarkItem(article, tags=["tech", "python"])
-        result = item._format()
+        result = item._format
         assert "tech" in result
         assert "python" in result
 
-    def test_format_without_tags(self) -> None:
+    def test_format_without_tags(self, article: Article) -> None:
         """No tag line when tags are absent."""
-        article = _make_article()
         item = BookmarkItem(article)
-        result = item._format()
+        result = item._format
         assert "🏷" not in result
 
 
@@ -145,14 +151,14 @@ class TestTagItem:
     def test_format_basic(self) -> None:
         """Default format includes tag name and article count."""
         item = TagItem("python", 5)
-        result = item._format()
+        result = item._format
         assert "python" in result
         assert "5" in result
 
     def test_format_zero_count(self) -> None:
         """Formats correctly even when article count is zero."""
         item = TagItem("empty-tag", 0)
-        result = item._format()
+        result = item._format
         assert "empty-tag" in result
         assert "0" in result
 
@@ -1,8 +1,11 @@
 """Tests for i18n multilingual support."""
 from __future__ import annotations
 
+import functools
 import re
 
+import pytest
+
 from hawaiidisco.i18n import (
     Lang,
     _STRINGS,
@@ -14,6 +17,48 @@ from hawaiidisco.i18n import (
     validate_locale,
 )
 
+# Locale files present in this install, read once at collection
+_AVAILABLE = frozenset(get_available_languages())
+
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+# Keys with format placeholders, and kwargs that fill every one of them
+_FORMAT_KEYS: dict[str, dict[str, object]] = {
+    "new_articles_found": {"count": 10},
+    "bookmark_added": {"title": "Test"},
+    "bookmark_removed": {"title": "Test"},
+    "searching": {"query": "test"},
+    "feed_added": {"name": "TestFeed"},
+    "last_refresh": {"time": "12:00"},
+    "minutes_ago": {"n": 5},
+    "hours_ago": {"n": 3},
+    "days_ago": {"n": 2},
+    "fetch_error": {"error": "timeout"},
+    "translated_preview": {"title": "test"},
+    "article_count": {"count": 42},
+}
+
+
+@functools.cache
+def _cached_validate(code: str) -> dict:
+    """Run validate_locale once per code; callers must not mutate the result."""
+    return validate_locale(code)
+
+
+@functools.cache
+def _placeholders() -> dict[str, dict[Lang, frozenset[str]]]:
+    """Return each key's placeholder names per language, scanned once."""
+    return {
+        key: {lang: frozenset(_PLACEHOLDER_RE.findall(text)) for lang, text in entry.items()}
+        for key, entry in _STRINGS.items()
+    }
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _all_locales() -> None:
+    """Load every locale once for the module instead of per test."""
+    load_all_locales()
+
 
 class TestSetLang:
     """Tests for set_lang / get_lang."""
@@ -23,35 +68,23 @@ class TestSetLang:
         set_lang("en")
         assert get_lang() == Lang.EN
 
-    def test_set_korean(self) -> None:
-        """Switch language to Korean."""
-        set_lang("ko")
-        assert get_lang() == Lang.KO
-        set_lang("en")  # restore
-
-    def test_set_japanese(self) -> None:
-        """Switch language to Japanese."""
-        set_lang("ja")
-        assert get_lang() == Lang.JA
-        set_lang("en")
-
-    def test_set_chinese(self) -> None:
-        """Switch language to Simplified Chinese."""
-        set_lang("zh-CN")
-        assert get_lang() == Lang.ZH_CN
-        set_lang("en")
-
-    def test_set_spanish(self) -> None:
-        """Switch language to Spanish."""
-        set_lang("es")
-        assert get_lang() == Lang.ES
-        set_lang("en")
-
-    def test_set_german(self) -> None:
-        """Switch language to German."""
-        set_lang("de")
-        assert get_lang() == Lang.DE
-        set_lang("en")
+    @pytest.mark.parametrize(
+        ("code", "lang", "quit_text"),
+        [
+            ("en", Lang.EN, "Quit"),
+            ("ko", Lang.KO, "종료"),
+            ("ja", Lang.JA, "終了"),
+            ("zh-CN", Lang.ZH_CN, "退出"),
+            ("es", Lang.ES, "Salir"),
+            ("de", Lang.DE, "Beenden"),
+        ],
+        ids=["en", "ko", "ja", "zh-CN", "es", "de"],
+    )
+    def test_set_and_translate(self, code: str, lang: Lang, quit_text: str) -> None:
+        """Switching language selects it and returns its strings."""
+        set_lang(code)
+        assert get_lang() == lang
+        assert t("quit") == quit_text
 
     def test_invalid_lang_falls_back_to_en(self) -> None:
         """Invalid language code falls back to English."""
@@ -72,47 +105,11 @@ class TestSetLang:
         """'auto' triggers system locale detection without crashing."""
         set_lang("auto")
         assert isinstance(get_lang(), Lang)
-        set_lang("en")
 
 
 class TestTranslation:
     """Tests for the t() translation function."""
 
-    def test_english_string(self) -> None:
-        """Return English string in English mode."""
-        set_lang("en")
-        assert t("quit") == "Quit"
-
-    def test_korean_string(self) -> None:
-        """Return Korean string in Korean mode."""
-        set_lang("ko")
-        assert t("quit") == "종료"
-        set_lang("en")
-
-    def test_japanese_string(self) -> None:
-        """Return Japanese string in Japanese mode."""
-        set_lang("ja")
-        assert t("quit") == "終了"
-        set_lang("en")
-
-    def test_chinese_string(self) -> None:
-        """Return Chinese string in Chinese mode."""
-        set_lang("zh-CN")
-        assert t("quit") == "退出"
-        set_lang("en")
-
-    def test_spanish_string(self) -> None:
-        """Return Spanish string in Spanish mode."""
-        set_lang("es")
-        assert t("quit") == "Salir"
-        set_lang("en")
-
-    def test_german_string(self) -> None:
-        """Return German string in German mode."""
-        set_lang("de")
-        assert t("quit") == "Beenden"
-        set_lang("en")
-
     def test_format_kwargs(self) -> None:
         """Format kwargs are correctly substituted."""
         set_lang("en")
@@ -124,14 +121,12 @@ class TestTranslation:
         set_lang("ko")
         result = t("new_articles_found", count=3)
         assert "3" in result
-        set_lang("en")
 
     def test_format_kwargs_japanese(self) -> None:
         """Format kwargs work in Japanese."""
         set_lang("ja")
         result = t("new_articles_found", count=7)
         assert "7" in result
-        set_lang("en")
 
     def test_missing_key_returns_key(self) -> None:
         """Missing key returns the key itself."""
@@ -147,7 +142,6 @@ class TestTranslation:
         assert en_text != ko_text
         assert en_text == "Refreshing..."
         assert ko_text == "새로고침 중..."
-        set_lang("en")
 
 
 class TestTranslationEdgeCases:
@@ -176,42 +170,27 @@ class TestTranslationEdgeCases:
         set_lang("en")
         assert t("") == ""
 
-    def test_fallback_to_english(self) -> None:
+    def test_fallback_to_english(self, monkeypatch) -> None:
         """A key missing in the current language falls back to English."""
         # Inject a temporary entry with only EN
-        _STRINGS["_test_en_only"] = {Lang.EN: "English only"}
+        monkeypatch.setitem(_STRINGS, "_test_en_only", {Lang.EN: "English only"})
         set_lang("ko")
         result = t("_test_en_only")
         assert result == "English only"
-        del _STRINGS["_test_en_only"]
-        set_lang("en")
 
-    def test_all_format_keys_produce_valid_output(self) -> None:
+    @pytest.mark.parametrize(
+        ("lang", "key"),
+        [(lang, key) for lang in Lang for key in _FORMAT_KEYS],
+        ids=lambda v: v.value if isinstance(v, Lang) else v,
+    )
+    def test_all_format_keys_produce_valid_output(self, lang: Lang, key: str) -> None:
         """All keys with format placeholders produce valid output in every language."""
-        format_keys = {
-            "new_articles_found": {"count": 10},
-            "bookmark_added": {"title": "Test"},
-            "bookmark_removed": {"title": "Test"},
-            "searching": {"query": "test"},
-            "feed_added": {"name": "TestFeed"},
-            "last_refresh": {"time": "12:00"},
-            "minutes_ago": {"n": 5},
-            "hours_ago": {"n": 3},
-            "days_ago": {"n": 2},
-            "fetch_error": {"error": "timeout"},
-            "translated_preview": {"title": "test"},
-            "article_count": {"count": 42},
-        }
-        load_all_locales()
-        for lang in Lang:
-            set_lang(lang.value)
-            for key, kwargs in format_keys.items():
-                result = t(key, **kwargs)
-                assert result, f"'{key}' ({lang.value}) empty result"
-                assert "{" not in result, (
-                    f"'{key}' ({lang.value}) unsubstituted placeholder: {result}"
-                )
-        set_lang("en")
+        set_lang(lang.value)
+        result = t(key, **_FORMAT_KEYS[key])
+        assert result, f"'{key}' ({lang.value}) empty result"
+        assert "{" not in result, (
+            f"'{key}' ({lang.value}) unsubstituted placeholder: {result}"
+        )
 
 
 class TestAllKeysConsistency:
@@ -219,87 +198,62 @@ class TestAllKeysConsistency:
 
     def test_all_keys_have_en(self) -> None:
         """Every key includes an English translation."""
-        load_all_locales()
         for key, entry in _STRINGS.items():
             assert Lang.EN in entry, f"'{key}' missing EN"
 
-    def test_en_ko_complete(self) -> None:
+    @pytest.mark.parametrize("lang", [Lang.EN, Lang.KO], ids=lambda lang: lang.value)
+    def test_en_ko_complete(self, lang: Lang) -> None:
         """EN and KO both have all keys (P0 languages)."""
-        load_all_locales()
-        for key, entry in _STRINGS.items():
-            assert Lang.EN in entry, f"'{key}' missing EN"
-            assert Lang.KO in entry, f"'{key}' missing KO"
+        missing = [key for key, entry in _STRINGS.items() if lang not in entry]
+        assert not missing, f"missing {lang.value}: {missing}"
 
-    def test_no_empty_translation_values(self) -> None:
+    @pytest.mark.parametrize("lang", list(Lang), ids=lambda lang: lang.value)
+    def test_no_empty_translation_values(self, lang: Lang) -> None:
         """No translation values are empty strings."""
-        load_all_locales()
-        for key, entry in _STRINGS.items():
-            for lang, text in entry.items():
-                assert text, f"'{key}' ({lang.value}) empty value"
+        empty = [key for key, entry in _STRINGS.items() if lang in entry and not entry[lang]]
+        assert not empty, f"({lang.value}) empty values: {empty}"
 
-    def test_format_placeholders_consistent(self) -> None:
+    @pytest.mark.parametrize("lang", [lang for lang in Lang if lang != Lang.EN], ids=lambda lang: lang.value)
+    def test_format_placeholders_consistent(self, lang: Lang) -> None:
         """All languages use the same format placeholders as English."""
-        load_all_locales()
-        placeholder_re = re.compile(r"\{(\w+)\}")
-        for key, entry in _STRINGS.items():
-            en_text = entry.get(Lang.EN, "")
-            en_placeholders = set(placeholder_re.findall(en_text))
-            for lang, text in entry.items():
-                if lang == Lang.EN:
-                    continue
-                lang_placeholders = set(placeholder_re.findall(text))
-                assert en_placeholders == lang_placeholders, (
-                    f"'{key}' placeholder mismatch: "
-                    f"EN={en_placeholders}, {lang.value}={lang_placeholders}"
-                )
+        for key, by_lang in _placeholders().items():
+            if lang not in by_lang:
+                continue
+            en_placeholders = by_lang.get(Lang.EN, frozenset())
+            assert en_placeholders == by_lang[lang], (
+                f"'{key}' placeholder mismatch: "
+                f"EN={set(en_placeholders)}, {lang.value}={set(by_lang[lang])}"
+            )
 
 
 class TestValidation:
     """Tests for the validate_locale helper."""
 
-    def test_validate_en(self) -> None:
-        """English should have 100% coverage."""
-        result = validate_locale("en")
-        assert result["coverage_pct"] == 100.0
-        assert result["missing"] == []
-
-    def test_validate_ko(self) -> None:
-        """Korean should have 100% coverage."""
-        result = validate_locale("ko")
+    @pytest.mark.parametrize(
+        "code",
+        [
+            pytest.param(
+                code, marks=pytest.mark.skipif(code not in _AVAILABLE, reason=f"{code} locale not installed")
+            )
+            for code in ("en", "ko", "ja", "zh-CN", "es", "de")
+        ],
+    )
+    def test_full_coverage(self, code: str) -> None:
+        """Every shipped locale has 100% coverage of the English keys."""
+        result = _cached_validate(code)
         assert result["coverage_pct"] == 100.0
         assert result["missing"] == []
 
-    def test_validate_ja(self) -> None:
-        """Japanese should have 100% coverage."""
-        result = validate_locale("ja")
-        assert result["coverage_pct"] == 100.0
-
-    def test_validate_zh_cn(self) -> None:
-        """Chinese should have 100% coverage."""
-        result = validate_locale("zh-CN")
-        assert result["coverage_pct"] == 100.0
-
-    def test_validate_es(self) -> None:
-        """Spanish should have 100% coverage."""
-        result = validate_locale("es")
-        assert result["coverage_pct"] == 100.0
-
-    def test_validate_de(self) -> None:
-        """German should have 100% coverage."""
-        result = validate_locale("de")
-        assert result["coverage_pct"] == 100.0
-
     def test_validate_unknown_code(self) -> None:
         """Unknown language code returns error."""
-        result = validate_locale("xx")
+        result = _cached_validate("xx")
         assert "error" in result
 
-    def test_no_placeholder_mismatches(self) -> None:
+    @pytest.mark.parametrize("code", sorted(_AVAILABLE))
+    def test_no_placeholder_mismatches(self, code: str) -> None:
         """No locale has placeholder mismatches."""
-        for code in get_available_languages():
-            result = validate_locale(code)
-            if "error" in result:
-                continue
+        result = _cached_validate(code)
+        if "error" not in result:
             assert result["placeholder_mismatch"] == [], (
                 f"{code} has placeholder mismatches: {result['placeholder_mismatch']}"
             )
@@ -1,16 +1,15 @@
 """Tests for insight generation with persona support."""
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime
-from unittest.mock import MagicMock
 
-import yaml
-from pathlib import Path
+import pytest
 
-from hawaiidisco.ai.base import AIProvider
-from hawaiidisco.config import load_config
+from hawaiidisco.config import Config, load_config
 from hawaiidisco.db import Article
 from hawaiidisco.insight import generate_insight, get_or_generate_insight
+from tests.helpers import _FakeProvider, _missing, _present
 
 
 def _make_article(**kwargs) -> Article:
@@ -30,41 +29,57 @@ def _make_article(**kwargs) -> Article:
     return Article(**defaults)
 
 
-def _make_provider(response: str = "Great insight") -> MagicMock:
-    provider = MagicMock(spec=AIProvider)
-    provider.name = "mock"
-    provider.is_available.return_value = True
-    provider.generate.return_value = response
-    return provider
+class _FakeDB:
+    """Stand-in for Database exposing only what get_or_generate_insight writes."""
 
+    def __init__(self) -> None:
+        self.insights: dict[str, str] = {}
 
-class TestGenerateInsightDefault:
-    """Tests for generate_insight without persona (default behavior)."""
+    def set_insight(self, article_id: str, insight: str) -> None:
+        self.insights[article_id] = insight
 
-    def test_uses_default_prompt_when_no_persona(self) -> None:
-        """Uses the default INSIGHT_PROMPT when persona is not set."""
-        article = _make_article()
-        provider = _make_provider()
 
-        generate_insight(article, provider, lang="en")
+def _make_provider(response: str = "Great insight", *, available: bool = True) -> _FakeProvider:
+    return _FakeProvider(response, available=available)
+
+
+@pytest.fixture(scope="module")
+def article() -> Article:
+    """Return the default article shared by the insight tests. Treat as read-only."""
+    return _make_article()
+
+
+# Config document for persona_config, written verbatim instead of dumped per run
+_PERSONA_YAML = """\
+feeds: []
+insight:
+  enabled: true
+  mode: manual
+  persona: 3년차 프론트엔드 개발자, React/Next.js 전문
+"""
+
+
+@pytest.fixture(scope="module")
+def persona_config(tmp_path_factory: pytest.TempPathFactory) -> Config:
+    """Return a Config with an insight persona, loaded once. Treat as read-only."""
+    config_file = tmp_path_factory.mktemp("cfg") / "config.yml"
+    config_file.write_text(_PERSONA_YAML, encoding="utf-8")
+    return load_config(config_file)
 
-        prompt_arg = provider.generate.call_args[0][0]
-        assert "intelligent reader" in prompt_arg
-        assert "reader_profile" not in prompt_arg
 
-    def test_returns_provider_response(self) -> None:
+class TestGenerateInsightDefault:
+    """Tests for generate_insight without persona (default behavior)."""
+
+    def test_returns_provider_response(self, article: Article) -> None:
         """Returns the AI provider's response."""
-        article = _make_article()
         provider = _make_provider("This matters because...")
 
         result = generate_insight(article, provider, lang="en")
         assert result == "This matters because..."
 
-    def test_returns_none_when_unavailable(self) -> None:
+    def test_returns_none_when_unavailable(self, article: Article) -> None:
         """Returns None when provider is unavailable."""
-        article = _make_article()
-        provider = _make_provider()
-        provider.is_available.return_value = False
+        provider = _make_provider(available=False)
 
         result = generate_insight(article, provider)
         assert result is None
@@ -73,74 +88,76 @@ class TestGenerateInsightDefault:
 class TestGenerateInsightPersona:
     """Tests for generate_insight with persona."""
 
-    def test_uses_persona_prompt_when_set(self) -> None:
-        """Uses INSIGHT_PROMPT_PERSONA when persona is set."""
-        article = _make_article()
+    @pytest.mark.parametrize(
+        ("kwargs", "must_contain", "must_not_contain"),
+        [
+            ({}, ["intelligent reader"], ["reader_profile"]),
+            ({"persona": ""}, ["intelligent reader"], ["reader_profile"]),
+            (
+                {"persona": "3년차 백엔드 개발자"},
+                ["reader_profile", "3년차 백엔드 개발자", "relevance to the reader's context"],
+                [],
+            ),
+        ],
+        ids=["no-persona", "empty-persona", "persona"],
+    )
+    def test_prompt_selection(
+        self, article: Article, kwargs: dict[str, str], must_contain: list[str], must_not_contain: list[str]
+    ) -> None:
+        """INSIGHT_PROMPT_PERSONA is used only when a non-empty persona is set."""
         provider = _make_provider()
 
-        generate_insight(article, provider, lang="en", persona="3년차 백엔드 개발자")
+        generate_insight(article, provider, lang="en", **kwargs)
 
-        prompt_arg = provider.generate.call_args[0][0]
-        assert "reader_profile" in prompt_arg
-        assert "3년차 백엔드 개발자" in prompt_arg
-        assert "relevance to the reader's context" in prompt_arg
+        prompt_arg = provider.calls[-1][0]
+        assert not _missing(prompt_arg, must_contain)
+        assert not _present(prompt_arg, must_not_contain)
 
-    def test_persona_includes_article_info(self) -> None:
+    def test_persona_includes_article_info(self, article: Article) -> None:
         """Persona prompt also includes article info."""
-        article = _make_article(title="Kubernetes 2.0", description="Major update")
+        article = replace(article, title="Kubernetes 2.0", description="Major update")
         provider = _make_provider()
 
         generate_insight(article, provider, lang="ko", persona="DevOps engineer")
 
-        prompt_arg = provider.generate.call_args[0][0]
-        assert "Kubernetes 2.0" in prompt_arg
-        assert "Major update" in prompt_arg
-        assert "Korean" in prompt_arg
-
-    def test_empty_persona_uses_default(self) -> None:
-        """Empty string persona uses the default prompt."""
-        article = _make_article()
-        provider = _make_provider()
-
-        generate_insight(article, provider, lang="en", persona="")
-
-        prompt_arg = provider.generate.call_args[0][0]
-        assert "intelligent reader" in prompt_arg
-        assert "reader_profile" not in prompt_arg
+        prompt_arg = provider.calls[-1][0]
+        assert not _missing(prompt_arg, ["Kubernetes 2.0", "Major update", "Korean"])
 
 
 class TestGetOrGenerateInsightPersona:
     """Tests for get_or_generate_insight with persona parameter."""
 
-    def test_passes_persona_to_generate(self) -> None:
+    def test_passes_persona_to_generate(self, article: Article) -> None:
         """Passes persona to generate_insight."""
-        article = _make_article()
         provider = _make_provider("Personalized insight")
-        db = MagicMock()
+        db = _FakeDB()
 
         result = get_or_generate_insight(article, db, provider, persona="PM at startup")
         assert result == "Personalized insight"
 
-        prompt_arg = provider.generate.call_args[0][0]
+        prompt_arg = provider.calls[-1][0]
         assert "PM at startup" in prompt_arg
+        assert db.insights == {"abc123": "Personalized insight"}
 
-    def test_cached_insight_skips_generation(self) -> None:
+    def test_cached_insight_skips_generation(self, article: Article) -> None:
         """Skips generation when a cached insight exists."""
-        article = _make_article(insight="Cached insight")
+        article = replace(article, insight="Cached insight")
         provider = _make_provider()
-        db = MagicMock()
+        db = _FakeDB()
 
         result = get_or_generate_insight(article, db, provider, persona="any persona")
         assert result == "Cached insight"
-        provider.generate.assert_not_called()
+        assert provider.calls == []
+        assert db.insights == {}
 
 
 class TestDomainAwareInsight:
     """Tests that insight prompts include domain-aware analysis instructions."""
 
-    def test_default_prompt_includes_domain_detection(self) -> None:
+    def test_default_prompt_includes_domain_detection(self, article: Article) -> None:
         """Default prompt instructs AI to identify article domain."""
-        article = _make_article(
+        article = replace(
+            article,
             title="Presidential Election Results",
             description="The opposition party won a landslide victory.",
         )
@@ -148,34 +165,31 @@ class TestDomainAwareInsight:
 
         generate_insight(article, provider, lang="en")
 
-        prompt_arg = provider.generate.call_args[0][0]
-        assert "identify the article's domain" in prompt_arg
-        assert "politics" in prompt_arg
+        prompt_arg = provider.calls[-1][0]
+        assert not _missing(prompt_arg, ["identify the article's domain", "politics"])
 
-    def test_default_prompt_forbids_tech_analysis_on_nontech(self) -> None:
+    def test_default_prompt_forbids_tech_analysis_on_nontech(self, article: Article) -> None:
         """Default prompt explicitly forbids tech analysis on non-tech articles."""
-        article = _make_article()
         provider = _make_provider()
 
         generate_insight(article, provider, lang="en")
 
-        prompt_arg = provider.generate.call_args[0][0]
+        prompt_arg = provider.calls[-1][0]
         assert "Do NOT analyze non-tech articles from a technical perspective" in prompt_arg
 
-    def test_default_prompt_includes_domain_examples(self) -> None:
+    def test_default_prompt_includes_domain_examples(self, article: Article) -> None:
         """Default prompt includes domain-specific analysis examples."""
-        article = _make_article()
         provider = _make_provider()
 
         generate_insight(article, provider, lang="en")
 
-        prompt_arg = provider.generate.call_args[0][0]
-        assert "political/policy perspective" in prompt_arg
-        assert "market/strategy perspective" in prompt_arg
+        prompt_arg = provider.calls[-1][0]
+        assert not _missing(prompt_arg, ["political/policy perspective", "market/strategy perspective"])
 
-    def test_persona_prompt_includes_domain_detection(self) -> None:
+    def test_persona_prompt_includes_domain_detection(self, article: Article) -> None:
         """Persona prompt also instructs AI to identify article domain."""
-        article = _make_article(
+        article = replace(
+            article,
             title="New Trade Tariffs Announced",
             description="Government imposes 25% tariffs on imports.",
         )
@@ -183,54 +197,39 @@ class TestDomainAwareInsight:
 
         generate_insight(article, provider, lang="en", persona="Backend developer")
 
-        prompt_arg = provider.generate.call_args[0][0]
-        assert "identify the article's domain" in prompt_arg
-        assert "Do NOT force a technical analysis on non-tech articles" in prompt_arg
+        prompt_arg = provider.calls[-1][0]
+        assert not _missing(
+            prompt_arg, ["identify the article's domain", "Do NOT force a technical analysis on non-tech articles"]
+        )
 
-    def test_persona_prompt_handles_cross_domain(self) -> None:
+    def test_persona_prompt_handles_cross_domain(self, article: Article) -> None:
         """Persona prompt instructs to analyze from article's domain when outside reader's domain."""
-        article = _make_article()
         provider = _make_provider()
 
         generate_insight(article, provider, lang="en", persona="Frontend developer")
 
-        prompt_arg = provider.generate.call_args[0][0]
-        assert "outside the reader's primary domain" in prompt_arg
-        assert "article's own domain perspective first" in prompt_arg
+        prompt_arg = provider.calls[-1][0]
+        assert not _missing(
+            prompt_arg, ["outside the reader's primary domain", "article's own domain perspective first"]
+        )
 
-    def test_persona_prompt_tailors_within_domain(self) -> None:
+    def test_persona_prompt_tailors_within_domain(self, article: Article) -> None:
         """Persona prompt tailors insight when article is within reader's domain."""
-        article = _make_article()
         provider = _make_provider()
 
         generate_insight(article, provider, lang="en", persona="ML engineer")
 
-        prompt_arg = provider.generate.call_args[0][0]
-        assert "within the reader's primary domain" in prompt_arg
-        assert "tailored to their role" in prompt_arg
+        prompt_arg = provider.calls[-1][0]
+        assert not _missing(prompt_arg, ["within the reader's primary domain", "tailored to their role"])
 
 
 class TestInsightConfigPersona:
     """Tests for persona field in InsightConfig."""
 
-    def test_default_persona_empty(self, tmp_path: Path) -> None:
+    def test_default_persona_empty(self, default_config: Config) -> None:
         """Default persona is an empty string."""
-        config_file = tmp_path / "config.yml"
-        config_file.write_text("feeds: []\n", encoding="utf-8")
-        config = load_config(config_file)
-        assert config.insight.persona == ""
+        assert default_config.insight.persona == ""
 
-    def test_persona_from_config(self, tmp_path: Path) -> None:
+    def test_persona_from_config(self, persona_config: Config) -> None:
         """Persona can be read from config."""
-        config_file = tmp_path / "config.yml"
-        data = {
-            "feeds": [],
-            "insight": {
-                "enabled": True,
-                "mode": "manual",
-                "persona": "3년차 프론트엔드 개발자, React/Next.js 전문",
-            },
-        }
-        config_file.write_text(yaml.dump(data, allow_unicode=True), encoding="utf-8")
-        config = load_config(config_file)
-        assert config.insight.persona == "3년차 프론트엔드 개발자, React/Next.js 전문"
+        assert persona_config.insight.persona == "3년차 프론트엔드 개발자, React/Next.js 전문"
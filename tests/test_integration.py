@@ -1,14 +1,15 @@
 """Integration tests for cross-module workflows."""
 from __future__ import annotations
 
-import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
-from hawaiidisco.ai.base import AIProvider
+from hawaiidisco.app import HawaiiDiscoApp
 from hawaiidisco.config import (
     Config,
     DigestConfig,
@@ -21,14 +22,28 @@ from hawaiidisco.digest import get_or_generate_digest
 from hawaiidisco.insight import get_or_generate_insight
 from hawaiidisco.obsidian import save_digest_note, save_obsidian_note
 from hawaiidisco.translate import translate_text
+from tests.helpers import _FakeProvider
 
 
 # --- Shared fixtures ---
 
 
+@pytest.fixture(scope="module")
+def _shared_db() -> Iterator[Database]:
+    """Create and migrate one in-memory database for the whole module."""
+    database = Database(Path(":memory:"))
+    yield database
+    database.close()
+
+
 @pytest.fixture()
-def db(tmp_path: Path) -> Database:
-    return Database(tmp_path / "test.db")
+def db(_shared_db: Database) -> Iterator[Database]:
+    """Hand out the shared database, emptied again after each test."""
+    yield _shared_db
+    with _shared_db._write_tx() as conn:
+        # Bookmarks and tags cascade; the FTS index and feed counts follow via triggers
+        conn.execute("DELETE FROM articles")
+        conn.execute("DELETE FROM digests")
 
 
 @pytest.fixture()
@@ -42,6 +57,28 @@ def obsidian_config(tmp_path: Path) -> ObsidianConfig:
     )
 
 
+@pytest.fixture(scope="module")
+def _app_mock() -> MagicMock:
+    """Build the spec'd HawaiiDiscoApp mock once; spec introspection walks the whole class."""
+    return MagicMock(spec=HawaiiDiscoApp)
+
+
+@pytest.fixture()
+def fake_app(_app_mock: MagicMock) -> MagicMock:
+    """Hand out the shared app mock with its calls cleared and a fresh config."""
+    _app_mock.reset_mock()
+    _app_mock.config = MagicMock()
+    return _app_mock
+
+
+# Timestamp used for both published_at and fetched_at in sample articles
+_DEFAULT_TS = datetime(2025, 1, 15, 10, 0)
+
+# Weekly digest settings shared by the digest tests; get_or_generate_digest only reads them
+_DIGEST_CFG = DigestConfig(enabled=True, period_days=7, max_articles=20)
+_BOOKMARKED_DIGEST_CFG = DigestConfig(enabled=True, period_days=7, bookmarked_only=True)
+
+
 def _make_article(
     article_id: str = "test-1",
     title: str = "Test Article",
@@ -57,22 +94,14 @@ def _make_article(
         title=title,
         link=f"https://example.com/{article_id}",
         description=description,
-        published_at=published_at or datetime(2025, 1, 15, 10, 0),
-        fetched_at=datetime(2025, 1, 15, 10, 0),
+        published_at=published_at or _DEFAULT_TS,
+        fetched_at=_DEFAULT_TS,
         is_read=False,
         is_bookmarked=is_bookmarked,
         insight=insight,
     )
 
 
-def _mock_provider(response: str | None = "AI response") -> MagicMock:
-    provider = MagicMock(spec=AIProvider)
-    provider.is_available.return_value = True
-    provider.generate.return_value = response
-    provider.name = "mock"
-    return provider
-
-
 def _insert_article(db: Database, article: Article) -> None:
     """Insert an article into the DB for testing."""
     db.upsert_article(
@@ -102,8 +131,10 @@ class TestFeedToDBFlow:
             ("art-2", "Feed A", "Article Two"),
             ("art-3", "Feed B", "Article Three"),
         ]
-        for aid, fname, title in feeds_data:
-            db.upsert_article(aid, fname, title, f"https://x.com/{aid}", "desc", datetime.now())
+        now = datetime.now()
+        db.upsert_articles(
+            (aid, fname, title, f"https://x.com/{aid}", "desc", now) for aid, fname, title in feeds_data
+        )
 
         articles = db.get_articles()
         assert len(articles) == 3
@@ -122,10 +153,10 @@ class TestFeedToDBFlow:
 
     def test_article_count_by_feed(self, db: Database) -> None:
         """Article count per feed is accurate."""
-        for i in range(5):
-            db.upsert_article(f"a-{i}", "Alpha", f"Title {i}", f"https://x.com/{i}", None, datetime.now())
-        for i in range(3):
-            db.upsert_article(f"b-{i}", "Beta", f"Title {i}", f"https://x.com/b{i}", None, datetime.now())
+        now = datetime.now()
+        rows = [(f"a-{i}", "Alpha", f"Title {i}", f"https://x.com/{i}", None, now) for i in range(5)]
+        rows += [(f"b-{i}", "Beta", f"Title {i}", f"https://x.com/b{i}", None, now) for i in range(3)]
+        assert db.upsert_articles(rows) == 8
 
         counts = db.get_article_count_by_feed()
         assert counts["Alpha"] == 5
@@ -140,12 +171,12 @@ class TestArticleInsightFlow:
         article = _make_article(article_id="ins-1")
         _insert_article(db, article)
 
-        provider = _mock_provider("This is a sharp insight about the article.")
+        provider = _FakeProvider("This is a sharp insight about the article.")
 
         # First call: generates insight
         result = get_or_generate_insight(article, db, provider)
         assert result == "This is a sharp insight about the article."
-        assert provider.generate.call_count == 1
+        assert len(provider.calls) == 1
 
         # Verify DB cache
         cached = db.get_article("ins-1")
@@ -156,15 +187,14 @@ class TestArticleInsightFlow:
         result2 = get_or_generate_insight(cached, db, provider)
         assert result2 == cached.insight
         # generate should NOT be called again (cache hit)
-        assert provider.generate.call_count == 1
+        assert len(provider.calls) == 1
 
     def test_provider_unavailable(self, db: Database) -> None:
         """When provider is unavailable, return fallback message."""
         article = _make_article()
         _insert_article(db, article)
 
-        provider = _mock_provider()
-        provider.is_available.return_value = False
+        provider = _FakeProvider(available=False)
 
         result = get_or_generate_insight(article, db, provider)
         assert "CLI" in result or "not found" in result.lower() or "찾을" in result
@@ -178,7 +208,7 @@ class TestArticleTranslationFlow:
         article = _make_article(article_id="trans-1")
         _insert_article(db, article)
 
-        provider = _mock_provider("번역된 본문입니다.")
+        provider = _FakeProvider("번역된 본문입니다.")
 
         # Translate
         result = translate_text("English body text", provider, lang="ko")
@@ -193,10 +223,10 @@ class TestArticleTranslationFlow:
 
     def test_translate_english_skips(self) -> None:
         """English user should skip translation."""
-        provider = _mock_provider()
+        provider = _FakeProvider()
         result = translate_text("Hello world", provider, lang="en")
         assert result is None
-        provider.generate.assert_not_called()
+        assert provider.calls == []
 
 
 class TestBookmarkObsidianFlow:
@@ -245,6 +275,7 @@ class TestDigestFlow:
     def test_generate_and_cache_digest(self, db: Database) -> None:
         """Generate digest from recent articles, verify cache."""
         # Insert 5 articles with recent dates
+        now = datetime.now()
         for i in range(5):
             db.upsert_article(
                 f"dig-{i}",
@@ -252,31 +283,29 @@ class TestDigestFlow:
                 f"Tech Article {i}",
                 f"https://x.com/{i}",
                 f"Description {i}",
-                datetime.now(),
+                now,
             )
 
-        provider = _mock_provider("## Key Themes\n- AI is everywhere\n## Top Highlights\n...")
-        config = DigestConfig(enabled=True, period_days=7, max_articles=20)
+        provider = _FakeProvider("## Key Themes\n- AI is everywhere\n## Top Highlights\n...")
 
-        content, count = get_or_generate_digest(db, provider, config)
+        content, count = get_or_generate_digest(db, provider, _DIGEST_CFG)
         assert "Key Themes" in content
         assert count == 5
-        provider.generate.assert_called_once()
+        assert len(provider.calls) == 1
 
         # Second call should hit cache (less than 1 day old)
-        content2, count2 = get_or_generate_digest(db, provider, config)
+        content2, count2 = get_or_generate_digest(db, provider, _DIGEST_CFG)
         assert content2 == content
         assert count2 == count
         # Provider should NOT be called again
-        assert provider.generate.call_count == 1
+        assert len(provider.calls) == 1
 
     def test_digest_no_articles_raises(self, db: Database) -> None:
         """Digest with no articles raises ValueError."""
-        provider = _mock_provider()
-        config = DigestConfig(enabled=True, period_days=7)
+        provider = _FakeProvider()
 
         with pytest.raises(ValueError):
-            get_or_generate_digest(db, provider, config)
+            get_or_generate_digest(db, provider, _DIGEST_CFG)
 
     def test_digest_to_obsidian(self, obsidian_config: ObsidianConfig) -> None:
         """Save digest to Obsidian and verify file structure."""
@@ -293,74 +322,101 @@ class TestDigestFlow:
     def test_digest_bookmarked_only(self, db: Database) -> None:
         """Digest with bookmarked_only should only use bookmarked articles."""
         # Insert 3 articles, bookmark 2
+        now = datetime.now()
         for i in range(3):
-            db.upsert_article(
-                f"dbm-{i}", "Feed", f"Title {i}", f"https://x.com/{i}", "desc", datetime.now()
-            )
+            db.upsert_article(f"dbm-{i}", "Feed", f"Title {i}", f"https://x.com/{i}", "desc", now)
         db.toggle_bookmark("dbm-0")
         db.toggle_bookmark("dbm-1")
 
-        provider = _mock_provider("Bookmarked digest")
-        config = DigestConfig(enabled=True, period_days=7, bookmarked_only=True)
+        provider = _FakeProvider("Bookmarked digest")
 
-        content, count = get_or_generate_digest(db, provider, config)
+        content, count = get_or_generate_digest(db, provider, _BOOKMARKED_DIGEST_CFG)
         assert content == "Bookmarked digest"
         assert count == 2
 
     def test_digest_invalidated_on_bookmark_change(self, db: Database) -> None:
         """Cached digest should be invalidated when bookmarks change."""
+        now = datetime.now()
         for i in range(3):
-            db.upsert_article(
-                f"inv-{i}", "Feed", f"Title {i}", f"https://x.com/{i}", "desc", datetime.now()
-            )
+            db.upsert_article(f"inv-{i}", "Feed", f"Title {i}", f"https://x.com/{i}", "desc", now)
         db.toggle_bookmark("inv-0")
         db.toggle_bookmark("inv-1")
 
-        provider = _mock_provider("Digest v1")
-        config = DigestConfig(enabled=True, period_days=7, bookmarked_only=True)
+        provider = _FakeProvider("Digest v1")
 
-        content, count = get_or_generate_digest(db, provider, config)
+        content, count = get_or_generate_digest(db, provider, _BOOKMARKED_DIGEST_CFG)
         assert content == "Digest v1"
         assert count == 2
-        assert provider.generate.call_count == 1
+        assert len(provider.calls) == 1
 
         # Same bookmarks → cache hit
-        content2, _ = get_or_generate_digest(db, provider, config)
+        content2, _ = get_or_generate_digest(db, provider, _BOOKMARKED_DIGEST_CFG)
         assert content2 == "Digest v1"
-        assert provider.generate.call_count == 1
+        assert len(provider.calls) == 1
 
         # Add a new bookmark → cache should be invalidated
         db.toggle_bookmark("inv-2")
-        provider.generate.return_value = "Digest v2"
+        provider.response = "Digest v2"
 
-        content3, count3 = get_or_generate_digest(db, provider, config)
+        content3, count3 = get_or_generate_digest(db, provider, _BOOKMARKED_DIGEST_CFG)
         assert content3 == "Digest v2"
         assert count3 == 3
-        assert provider.generate.call_count == 2
+        assert len(provider.calls) == 2
 
     def test_digest_invalidated_on_new_articles(self, db: Database) -> None:
         """Cached digest should be invalidated when new articles appear."""
+        now = datetime.now()
         for i in range(3):
-            db.upsert_article(
-                f"new-{i}", "Feed", f"Title {i}", f"https://x.com/{i}", "desc", datetime.now()
-            )
+            db.upsert_article(f"new-{i}", "Feed", f"Title {i}", f"https://x.com/{i}", "desc", now)
 
-        provider = _mock_provider("Digest v1")
-        config = DigestConfig(enabled=True, period_days=7)
+        provider = _FakeProvider("Digest v1")
 
-        content, count = get_or_generate_digest(db, provider, config)
+        content, count = get_or_generate_digest(db, provider, _DIGEST_CFG)
         assert content == "Digest v1"
         assert count == 3
-        assert provider.generate.call_count == 1
+        assert len(provider.calls) == 1
 
         # Add new article → cache should be invalidated
         db.upsert_article("new-3", "Feed", "Title 3", "https://x.com/3", "desc", datetime.now())
-        provider.generate.return_value = "Digest v2"
+        provider.response = "Digest v2"
 
-        content2, count2 = get_or_generate_digest(db, provider, config)
+        content2, count2 = get_or_generate_digest(db, provider, _DIGEST_CFG)
         assert content2 == "Digest v2"
         assert count2 == 4
-        assert provider.generate.call_count == 2
+        assert len(provider.calls) == 2
+
+
+class TestDigestThreadSafety:
+    """Digest generation from worker thread → main thread read."""
+
+    def test_save_digest_from_thread(self, db: Database, executor: ThreadPoolExecutor) -> None:
+        """Save digest from a background thread, read from main thread."""
+        # Insert articles
+        now = datetime.now()
+        for i in range(3):
+            db.upsert_article(f"ts-{i}", "Feed", f"Title {i}", f"https://x.com/{i}", "desc", now)
+
+        executor.submit(db.save_digest, 7, 3, "Thread-generated digest content").result()
+
+        # Read from main thread
+        digest = db.get_latest_digest(7)
+        assert digest is not None
+        assert digest.content == "Thread-generated digest content"
+        assert digest.article_count == 3
+
+    def test_concurrent_digest_operations(self, db: Database, executor: ThreadPoolExecutor) -> None:
+        """Multiple threads saving digests concurrently."""
+
+        def worker(period: int) -> int:
+            return db.save_digest(period, 5, f"Digest for {period} days")
+
+        # Any exception raised in a worker is re-raised here
+        list(executor.map(worker, range(1, 6)))
+
+        for period in range(1, 6):
+            digest = db.get_latest_digest(period)
+            assert digest is not None
+            assert digest.content == f"Digest for {period} days"
 
 
 class TestConfigBootstrapFlow:
@@ -406,102 +462,42 @@ class TestConfigBootstrapFlow:
         assert config.digest.period_days == 7
 
 
-class TestDigestThreadSafety:
-    """Digest generation from worker thread → main thread read."""
-
-    def test_save_digest_from_thread(self, db: Database) -> None:
-        """Save digest from a background thread, read from main thread."""
-        # Insert articles
-        for i in range(3):
-            db.upsert_article(
-                f"ts-{i}", "Feed", f"Title {i}", f"https://x.com/{i}", "desc", datetime.now()
-            )
-
-        result_holder: dict = {}
-
-        def worker():
-            content = "Thread-generated digest content"
-            digest_id = db.save_digest(7, 3, content)
-            result_holder["id"] = digest_id
-
-        thread = threading.Thread(target=worker)
-        thread.start()
-        thread.join()
-
-        # Read from main thread
-        assert "id" in result_holder
-        digest = db.get_latest_digest(7)
-        assert digest is not None
-        assert digest.content == "Thread-generated digest content"
-        assert digest.article_count == 3
-
-    def test_concurrent_digest_operations(self, db: Database) -> None:
-        """Multiple threads saving digests concurrently."""
-        errors: list[Exception] = []
-
-        def worker(period: int):
-            try:
-                db.save_digest(period, 5, f"Digest for {period} days")
-            except Exception as e:
-                errors.append(e)
-
-        threads = [threading.Thread(target=worker, args=(i,)) for i in range(1, 6)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
-        assert len(errors) == 0, f"Errors in threads: {errors}"
-
-
 class TestDigestObsidianSaveMethod:
     """Test _save_digest_to_obsidian uses notify (not StatusBar query)."""
 
-    def test_save_success_notifies(self, obsidian_config: ObsidianConfig) -> None:
+    def test_save_success_notifies(self, fake_app: MagicMock, obsidian_config: ObsidianConfig) -> None:
         """Successful Obsidian save calls notify, not query_one(StatusBar)."""
-        from hawaiidisco.app import HawaiiDiscoApp
-
-        fake_self = MagicMock(spec=HawaiiDiscoApp)
-        fake_self.config = MagicMock()
-        fake_self.config.obsidian = obsidian_config
-        fake_self.config.digest.period_days = 7
+        fake_app.config.obsidian = obsidian_config
+        fake_app.config.digest.period_days = 7
 
         content = "## Themes\n- AI"
-        HawaiiDiscoApp._save_digest_to_obsidian(fake_self, content, 3)
+        HawaiiDiscoApp._save_digest_to_obsidian(fake_app, content, 3)
 
-        fake_self.notify.assert_called_once()
-        assert "obsidian" in fake_self.notify.call_args[0][0].lower() or "저장" in fake_self.notify.call_args[0][0]
+        fake_app.notify.assert_called_once()
+        assert "obsidian" in fake_app.notify.call_args[0][0].lower() or "저장" in fake_app.notify.call_args[0][0]
         # Must NOT touch query_one
-        fake_self.query_one.assert_not_called()
+        fake_app.query_one.assert_not_called()
 
-    def test_disabled_obsidian_notifies(self) -> None:
+    def test_disabled_obsidian_notifies(self, fake_app: MagicMock) -> None:
         """Disabled Obsidian config calls notify with warning."""
-        from hawaiidisco.app import HawaiiDiscoApp
+        fake_app.config.obsidian = ObsidianConfig(enabled=False)
 
-        fake_self = MagicMock(spec=HawaiiDiscoApp)
-        fake_self.config = MagicMock()
-        fake_self.config.obsidian = ObsidianConfig(enabled=False)
+        HawaiiDiscoApp._save_digest_to_obsidian(fake_app, "content", 1)
 
-        HawaiiDiscoApp._save_digest_to_obsidian(fake_self, "content", 1)
+        fake_app.notify.assert_called_once()
+        assert fake_app.notify.call_args[1].get("severity") == "warning"
+        fake_app.query_one.assert_not_called()
 
-        fake_self.notify.assert_called_once()
-        assert fake_self.notify.call_args[1].get("severity") == "warning"
-        fake_self.query_one.assert_not_called()
-
-    def test_invalid_vault_notifies(self, tmp_path: Path) -> None:
+    def test_invalid_vault_notifies(self, fake_app: MagicMock, tmp_path: Path) -> None:
         """Invalid vault path calls notify with error."""
-        from hawaiidisco.app import HawaiiDiscoApp
-
-        fake_self = MagicMock(spec=HawaiiDiscoApp)
-        fake_self.config = MagicMock()
-        fake_self.config.obsidian = ObsidianConfig(
+        fake_app.config.obsidian = ObsidianConfig(
             enabled=True,
             vault_path=tmp_path / "nonexistent",
             folder="notes",
         )
 
-        HawaiiDiscoApp._save_digest_to_obsidian(fake_self, "content", 1)
+        HawaiiDiscoApp._save_digest_to_obsidian(fake_app, "content", 1)
 
-        fake_self.notify.assert_called_once()
-        assert fake_self.notify.call_args[1].get("severity") == "error"
-        fake_self.query_one.assert_not_called()
+        fake_app.notify.assert_called_once()
+        assert fake_app.notify.call_args[1].get("severity") == "error"
+        fake_app.query_one.assert_not_called()
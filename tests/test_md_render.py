@@ -28,24 +28,26 @@ def _make_article(**kwargs: object) -> Article:
 
 
 class TestSlugify:
-    def test_basic(self) -> None:
-        assert slugify("Hello World") == "Hello-World"
-
-    def test_korean_preserved(self) -> None:
-        assert "한글" in slugify("한글 테스트")
-
-    def test_special_chars_removed(self) -> None:
-        result = slugify("Hello! @World# $%")
-        assert "!" not in result
-        assert "@" not in result
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [("Hello World", "Hello-World"), ("한글 테스트", "한글-테스트")],
+        ids=["ascii", "korean"],
+    )
+    def test_slug(self, text: str, expected: str) -> None:
+        assert slugify(text) == expected
+
+    @pytest.mark.parametrize(
+        ("text", "forbidden"),
+        [("Hello! @World# $%", "!@"), ("../../etc/passwd", "/")],
+        ids=["special-chars", "path-traversal"],
+    )
+    def test_unsafe_chars_removed(self, text: str, forbidden: str) -> None:
+        result = slugify(text)
+        assert not any(ch in result for ch in forbidden)
 
     def test_max_len(self) -> None:
         assert len(slugify("a" * 100, max_len=30)) <= 30
 
-    def test_path_traversal_chars_removed(self) -> None:
-        result = slugify("../../etc/passwd")
-        assert "/" not in result
-
 
 class TestSafePath:
     def test_normal(self, tmp_path: Path) -> None:
@@ -62,29 +64,29 @@ class TestSafePath:
 
 
 class TestArticleDateStr:
-    def test_uses_published_at(self) -> None:
-        article = _make_article(published_at=datetime(2025, 3, 1))
-        assert article_date_str(article) == "2025-03-01"
-
-    def test_falls_back_to_fetched_at(self) -> None:
-        article = _make_article(published_at=None, fetched_at=datetime(2025, 4, 15, 10, 0))
-        assert article_date_str(article) == "2025-04-15"
+    @pytest.mark.parametrize(
+        ("published_at", "fetched_at", "expected"),
+        [
+            (datetime(2025, 3, 1), datetime(2025, 2, 16, 12, 0), "2025-03-01"),
+            (None, datetime(2025, 4, 15, 10, 0), "2025-04-15"),
+        ],
+        ids=["published-at", "fetched-at-fallback"],
+    )
+    def test_date(self, published_at: datetime | None, fetched_at: datetime, expected: str) -> None:
+        article = _make_article(published_at=published_at, fetched_at=fetched_at)
+        assert article_date_str(article) == expected
 
 
 class TestFeedSubfolderName:
-    def test_basic(self) -> None:
-        assert feed_subfolder_name("HackerNews") == "HackerNews"
-
-    def test_spaces_replaced(self) -> None:
-        assert feed_subfolder_name("Hacker News") == "Hacker-News"
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [("HackerNews", "HackerNews"), ("Hacker News", "Hacker-News"), ("   ", "unknown"), ("긱뉴스", "긱뉴스")],
+        ids=["basic", "spaces", "empty", "korean"],
+    )
+    def test_name(self, name: str, expected: str) -> None:
+        assert feed_subfolder_name(name) == expected
 
     def test_special_chars_removed(self) -> None:
         result = feed_subfolder_name("Feed/Name@#!")
         assert "/" not in result
         assert "@" not in result
-
-    def test_empty_becomes_unknown(self) -> None:
-        assert feed_subfolder_name("   ") == "unknown"
-
-    def test_korean_preserved(self) -> None:
-        assert "긱뉴스" in feed_subfolder_name("긱뉴스")
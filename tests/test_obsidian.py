@@ -1,6 +1,7 @@
 """Tests for Obsidian vault integration."""
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 
@@ -17,169 +18,175 @@ from hawaiidisco.obsidian import (
     save_obsidian_note,
     validate_vault_path,
 )
+from tests.helpers import _missing, _present
+
+
+# Default article; tests derive variants with dataclasses.replace
+_ARTICLE_PROTO = Article(
+    id="test-1",
+    feed_name="HackerNews",
+    title="Test Article Title",
+    link="https://example.com/article",
+    description="A test article description",
+    published_at=datetime(2025, 2, 16),
+    fetched_at=datetime(2025, 2, 16, 12, 0),
+    is_read=False,
+    is_bookmarked=True,
+    insight=None,
+)
+
+
+# Settings shared by the obsidian configs; only the vault path differs between fixtures
+_CONFIG_TEMPLATE = ObsidianConfig(
+    enabled=True,
+    folder="hawaii-disco",
+    tags_prefix="hawaiidisco",
+    include_insight=True,
+    include_translation=True,
+)
+
 
+@pytest.fixture(scope="session")
+def article() -> Article:
+    """Return the default article shared by every test. Treat as read-only."""
+    return _ARTICLE_PROTO
 
-def _make_article(**kwargs: object) -> Article:
-    defaults: dict = {
-        "id": "test-1",
-        "feed_name": "HackerNews",
-        "title": "Test Article Title",
-        "link": "https://example.com/article",
-        "description": "A test article description",
-        "published_at": datetime(2025, 2, 16),
-        "fetched_at": datetime(2025, 2, 16, 12, 0),
-        "is_read": False,
-        "is_bookmarked": True,
-        "insight": None,
-        "translated_title": None,
-        "translated_desc": None,
-        "translated_body": None,
-    }
-    defaults.update(kwargs)
-    return Article(**defaults)
+
+@pytest.fixture(scope="module")
+def obsidian_config(tmp_path_factory: pytest.TempPathFactory) -> ObsidianConfig:
+    """Return a config on one vault shared by the module. Only for tests that write nothing."""
+    return replace(_CONFIG_TEMPLATE, vault_path=tmp_path_factory.mktemp("vault"))
 
 
 @pytest.fixture()
-def obsidian_config(tmp_path: Path) -> ObsidianConfig:
+def vault_config(tmp_path: Path) -> ObsidianConfig:
+    """Return a config on a vault private to this test, for tests that save or delete notes."""
     vault = tmp_path / "vault"
     vault.mkdir()
-    return ObsidianConfig(
-        enabled=True,
-        vault_path=vault,
-        folder="hawaii-disco",
-        tags_prefix="hawaiidisco",
-        include_insight=True,
-        include_translation=True,
-    )
+    return replace(_CONFIG_TEMPLATE, vault_path=vault)
+
+
+@pytest.fixture(scope="module")
+def saved_note(article: Article, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Save the default article once into its own vault and return the note path."""
+    return save_obsidian_note(article, replace(_CONFIG_TEMPLATE, vault_path=tmp_path_factory.mktemp("vault")))
+
+
+@pytest.fixture(scope="module")
+def saved_text(saved_note: Path) -> str:
+    """Return the contents of ``saved_note``, read once."""
+    return saved_note.read_text(encoding="utf-8")
 
 
 # --- Frontmatter ---
 
 
 class TestBuildFrontmatter:
-    def test_basic_frontmatter(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article()
+    def test_basic_frontmatter(self, article: Article, obsidian_config: ObsidianConfig) -> None:
         fm = _build_frontmatter(article, obsidian_config)
         assert fm.startswith("---")
         assert fm.endswith("---")
-        assert 'title: "Test Article Title"' in fm
-        assert "source: https://example.com/article" in fm
-        assert "feed: HackerNews" in fm
-        assert "date: 2025-02-16" in fm
-        assert "  - hawaiidisco" in fm
-        assert "  - hawaiidisco/HackerNews" in fm
-        assert "created_by: hawaiidisco" in fm
-
-    def test_title_with_quotes_escaped(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article(title='Title with "quotes"')
+        assert not _missing(
+            fm,
+            [
+                'title: "Test Article Title"',
+                "source: https://example.com/article",
+                "feed: HackerNews",
+                "date: 2025-02-16",
+                "  - hawaiidisco",
+                "  - hawaiidisco/HackerNews",
+                "created_by: hawaiidisco",
+            ],
+        )
+
+    def test_title_with_quotes_escaped(self, article: Article, obsidian_config: ObsidianConfig) -> None:
+        article = replace(article, title='Title with "quotes"')
         fm = _build_frontmatter(article, obsidian_config)
         assert r"\"quotes\"" in fm
 
-    def test_user_tags_included(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article()
+    def test_user_tags_included(self, article: Article, obsidian_config: ObsidianConfig) -> None:
         fm = _build_frontmatter(article, obsidian_config, tags=["python", "ai"])
-        assert "  - hawaiidisco/python" in fm
-        assert "  - hawaiidisco/ai" in fm
+        assert not _missing(fm, ["  - hawaiidisco/python", "  - hawaiidisco/ai"])
 
-    def test_custom_prefix(self, tmp_path: Path) -> None:
-        vault = tmp_path / "vault"
-        vault.mkdir()
-        config = ObsidianConfig(enabled=True, vault_path=vault, tags_prefix="hd")
-        article = _make_article()
+    def test_custom_prefix(self, article: Article, obsidian_config: ObsidianConfig) -> None:
+        config = replace(obsidian_config, tags_prefix="hd")
         fm = _build_frontmatter(article, config)
-        assert "  - hd" in fm
-        assert "  - hd/HackerNews" in fm
+        assert not _missing(fm, ["  - hd", "  - hd/HackerNews"])
 
 
 # --- Body ---
 
 
 class TestBuildBody:
-    def test_includes_title_and_summary(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article()
-        body = _build_body(article, obsidian_config)
-        assert "# Test Article Title" in body
-        assert "## Summary" in body
-        assert "A test article description" in body
-
-    def test_no_description_placeholder(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article(description=None)
-        body = _build_body(article, obsidian_config)
-        assert "*(No summary available)*" in body
-
-    def test_insight_included_when_present(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article(insight="This is an AI insight")
-        body = _build_body(article, obsidian_config)
-        assert "## AI Insight" in body
-        assert "This is an AI insight" in body
-
-    def test_insight_excluded_when_disabled(self, tmp_path: Path) -> None:
-        vault = tmp_path / "vault"
-        vault.mkdir()
-        config = ObsidianConfig(enabled=True, vault_path=vault, include_insight=False)
-        article = _make_article(insight="Hidden insight")
-        body = _build_body(article, config)
-        assert "## AI Insight" not in body
-
-    def test_insight_excluded_when_none(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article(insight=None)
-        body = _build_body(article, obsidian_config)
-        assert "## AI Insight" not in body
-
-    def test_translation_included(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article(
-            translated_title="번역된 제목",
-            translated_desc="번역된 설명",
-        )
-        body = _build_body(article, obsidian_config)
-        assert "## Translation" in body
-        assert "번역된 제목" in body
-        assert "번역된 설명" in body
-
-    def test_translation_excluded_when_disabled(self, tmp_path: Path) -> None:
-        vault = tmp_path / "vault"
-        vault.mkdir()
-        config = ObsidianConfig(enabled=True, vault_path=vault, include_translation=False)
-        article = _make_article(translated_title="번역")
-        body = _build_body(article, config)
-        assert "## Translation" not in body
+    @pytest.mark.parametrize(
+        ("article_kwargs", "config_kwargs", "expected", "forbidden"),
+        [
+            pytest.param(
+                {}, {}, ["# Test Article Title", "## Summary", "A test article description"], [], id="basic"
+            ),
+            pytest.param({"description": None}, {}, ["*(No summary available)*"], [], id="no-description"),
+            pytest.param(
+                {"insight": "This is an AI insight"}, {}, ["## AI Insight", "This is an AI insight"], [], id="insight"
+            ),
+            pytest.param(
+                {"insight": "Hidden insight"}, {"include_insight": False}, [], ["## AI Insight"], id="insight-disabled"
+            ),
+            pytest.param({"insight": None}, {}, [], ["## AI Insight"], id="insight-none"),
+            pytest.param(
+                {"translated_title": "번역된 제목", "translated_desc": "번역된 설명"},
+                {},
+                ["## Translation", "번역된 제목", "번역된 설명"],
+                [],
+                id="translation",
+            ),
+            pytest.param(
+                {"translated_title": "번역"},
+                {"include_translation": False},
+                [],
+                ["## Translation"],
+                id="translation-disabled",
+            ),
+            pytest.param({}, {}, ["*(No notes yet)*"], [], id="default-memo"),
+        ],
+    )
+    def test_sections(
+        self,
+        article: Article,
+        obsidian_config: ObsidianConfig,
+        article_kwargs: dict,
+        config_kwargs: dict,
+        expected: list[str],
+        forbidden: list[str],
+    ) -> None:
+        body = _build_body(replace(article, **article_kwargs), replace(obsidian_config, **config_kwargs))
+        assert not _missing(body, expected)
+        assert not _present(body, forbidden)
 
-    def test_memo_included(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article()
+    def test_memo_included(self, article: Article, obsidian_config: ObsidianConfig) -> None:
         body = _build_body(article, obsidian_config, memo="My personal note")
-        assert "## My Notes" in body
-        assert "My personal note" in body
-
-    def test_default_memo_placeholder(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article()
-        body = _build_body(article, obsidian_config)
-        assert "*(No notes yet)*" in body
+        assert not _missing(body, ["## My Notes", "My personal note"])
 
-    def test_footer_present(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article()
+    def test_footer_present(self, article: Article, obsidian_config: ObsidianConfig) -> None:
         body = _build_body(article, obsidian_config)
-        assert "Saved from Hawaii Disco on" in body
-        assert f"[{article.title}]({article.link})" in body
+        assert not _missing(body, ["Saved from Hawaii Disco on", f"[{article.title}]({article.link})"])
 
 
 # --- Note Path ---
 
 
 class TestNotePath:
-    def test_feed_subfolder_structure(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article()
+    def test_feed_subfolder_structure(self, article: Article, obsidian_config: ObsidianConfig) -> None:
         path = _note_path(article, obsidian_config)
         assert "hawaii-disco" in str(path)
         assert "HackerNews" in str(path)
         assert path.name == "2025-02-16_Test-Article-Title.md"
 
-    def test_path_within_vault(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article()
+    def test_path_within_vault(self, article: Article, obsidian_config: ObsidianConfig) -> None:
         path = _note_path(article, obsidian_config)
         assert path.is_relative_to(obsidian_config.vault_path)
 
-    def test_korean_title(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article(title="한국어 제목 테스트")
+    def test_korean_title(self, article: Article, obsidian_config: ObsidianConfig) -> None:
+        article = replace(article, title="한국어 제목 테스트")
         path = _note_path(article, obsidian_config)
         assert "한국어-제목-테스트" in path.name
 
@@ -188,74 +195,57 @@ class TestNotePath:
 
 
 class TestSaveObsidianNote:
-    def test_creates_note_file(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article()
-        filepath = save_obsidian_note(article, obsidian_config)
-        assert filepath.exists()
-        content = filepath.read_text(encoding="utf-8")
-        assert "---" in content
-        assert "# Test Article Title" in content
+    def test_creates_note_file(self, saved_note: Path, saved_text: str) -> None:
+        assert saved_note.exists()
+        assert not _missing(saved_text, ["---", "# Test Article Title"])
 
-    def test_creates_feed_subdirectory(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article()
-        filepath = save_obsidian_note(article, obsidian_config)
-        assert filepath.parent.name == "HackerNews"
+    def test_creates_feed_subdirectory(self, saved_note: Path) -> None:
+        assert saved_note.parent.name == "HackerNews"
 
-    def test_frontmatter_in_content(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article()
-        filepath = save_obsidian_note(article, obsidian_config)
-        content = filepath.read_text(encoding="utf-8")
-        assert content.startswith("---\n")
-        assert "created_by: hawaiidisco" in content
+    def test_frontmatter_in_content(self, saved_text: str) -> None:
+        assert saved_text.startswith("---\n")
+        assert "created_by: hawaiidisco" in saved_text
 
-    def test_with_all_data(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article(
+    def test_with_all_data(self, article: Article, vault_config: ObsidianConfig) -> None:
+        article = replace(
+            article,
             insight="Great insight",
             translated_title="번역 제목",
             translated_desc="번역 설명",
         )
-        filepath = save_obsidian_note(article, obsidian_config, memo="My memo", tags=["tech"])
+        filepath = save_obsidian_note(article, vault_config, memo="My memo", tags=["tech"])
         content = filepath.read_text(encoding="utf-8")
-        assert "Great insight" in content
-        assert "번역 제목" in content
-        assert "My memo" in content
-        assert "hawaiidisco/tech" in content
+        assert not _missing(content, ["Great insight", "번역 제목", "My memo", "hawaiidisco/tech"])
 
-    def test_update_existing_note(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article()
-        save_obsidian_note(article, obsidian_config, memo="First memo")
+    def test_update_existing_note(self, article: Article, vault_config: ObsidianConfig) -> None:
+        save_obsidian_note(article, vault_config, memo="First memo")
 
-        article_with_insight = _make_article(insight="New insight")
-        filepath = save_obsidian_note(article_with_insight, obsidian_config, memo="Updated memo")
+        article_with_insight = replace(article, insight="New insight")
+        filepath = save_obsidian_note(article_with_insight, vault_config, memo="Updated memo")
         content = filepath.read_text(encoding="utf-8")
-        assert "New insight" in content
-        assert "Updated memo" in content
+        assert not _missing(content, ["New insight", "Updated memo"])
 
     def test_preserves_memo_on_update_without_new_memo(
-        self, obsidian_config: ObsidianConfig
+        self, article: Article, vault_config: ObsidianConfig
     ) -> None:
-        article = _make_article()
-        save_obsidian_note(article, obsidian_config, memo="Original memo")
+        save_obsidian_note(article, vault_config, memo="Original memo")
 
-        article_with_insight = _make_article(insight="New insight")
-        filepath = save_obsidian_note(article_with_insight, obsidian_config)
+        article_with_insight = replace(article, insight="New insight")
+        filepath = save_obsidian_note(article_with_insight, vault_config)
         content = filepath.read_text(encoding="utf-8")
-        assert "Original memo" in content
-        assert "New insight" in content
+        assert not _missing(content, ["Original memo", "New insight"])
 
 
 class TestDeleteObsidianNote:
-    def test_deletes_existing_note(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article()
-        filepath = save_obsidian_note(article, obsidian_config)
+    def test_deletes_existing_note(self, article: Article, vault_config: ObsidianConfig) -> None:
+        filepath = save_obsidian_note(article, vault_config)
         assert filepath.exists()
-        delete_obsidian_note(article, obsidian_config)
+        delete_obsidian_note(article, vault_config)
         assert not filepath.exists()
 
-    def test_no_error_when_note_missing(self, obsidian_config: ObsidianConfig) -> None:
-        article = _make_article()
+    def test_no_error_when_note_missing(self, article: Article, vault_config: ObsidianConfig) -> None:
         # Should not raise
-        delete_obsidian_note(article, obsidian_config)
+        delete_obsidian_note(article, vault_config)
 
 
 # --- Validate Vault ---
@@ -285,22 +275,15 @@ class TestValidateVaultPath:
 
 
 class TestExtractExistingMemo:
-    def test_extract_memo(self) -> None:
-        content = "## My Notes\n\nExisting user memo\n\n---\n*Saved from*"
-        assert _extract_existing_memo(content) == "Existing user memo"
-
-    def test_no_memo_section(self) -> None:
-        content = "# Title\n## Summary\nSome text"
-        assert _extract_existing_memo(content) is None
-
-    def test_default_placeholder_returns_none(self) -> None:
-        content = "## My Notes\n\n*(No notes yet)*\n\n---"
-        assert _extract_existing_memo(content) is None
-
-    def test_multiline_memo(self) -> None:
-        content = "## My Notes\n\nLine 1\nLine 2\nLine 3\n\n---\n*Saved*"
-        result = _extract_existing_memo(content)
-        assert result is not None
-        assert "Line 1" in result
-        assert "Line 2" in result
-        assert "Line 3" in result
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ("## My Notes\n\nExisting user memo\n\n---\n*Saved from*", "Existing user memo"),
+            ("# Title\n## Summary\nSome text", None),
+            ("## My Notes\n\n*(No notes yet)*\n\n---", None),
+            ("## My Notes\n\nLine 1\nLine 2\nLine 3\n\n---\n*Saved*", "Line 1\nLine 2\nLine 3"),
+        ],
+        ids=["memo", "no-memo-section", "default-placeholder", "multiline"],
+    )
+    def test_extract(self, content: str, expected: str | None) -> None:
+        assert _extract_existing_memo(content) == expected
@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 
 from hawaiidisco.bookmark import _safe_path, _slugify
+from hawaiidisco.config import Config, ensure_dirs, load_config
 from hawaiidisco.db import Database
 from hawaiidisco.i18n import set_lang
 
@@ -187,8 +188,6 @@ class TestAppleScriptEscape:
 
 class TestDirectoryPermissions:
     def test_ensure_dirs_sets_700(self, tmp_path: Path) -> None:
-        from hawaiidisco.config import Config, ensure_dirs
-
         db_dir = tmp_path / "data"
         bm_dir = tmp_path / "bookmarks"
         config = Config(
@@ -261,8 +260,6 @@ class TestOpmlUrlSchemeValidation:
 class TestConfigAllowInsecureSsl:
     def test_default_is_false(self, tmp_path: Path) -> None:
         """allow_insecure_ssl defaults to False."""
-        from hawaiidisco.config import load_config
-
         config_file = tmp_path / "config.yml"
         config_file.write_text("language: en\n")
         config = load_config(config_file)
@@ -270,8 +267,6 @@ class TestConfigAllowInsecureSsl:
 
     def test_explicit_true(self, tmp_path: Path) -> None:
         """allow_insecure_ssl can be set to true."""
-        from hawaiidisco.config import load_config
-
         config_file = tmp_path / "config.yml"
         config_file.write_text("language: en\nallow_insecure_ssl: true\n")
         config = load_config(config_file)
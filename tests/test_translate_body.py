@@ -152,6 +152,14 @@ class TestTranslateTextTimeout:
         prompt = provider.generate.call_args[0][0]
         assert "Korean" in prompt
 
+    def test_braces_in_text_preserved(self) -> None:
+        """Braces in the source text are passed through verbatim."""
+        provider = _make_mock_provider(output="번역됨")
+        translate_text("use {output_language} and {text}", provider, lang="ja")
+        prompt = provider.generate.call_args[0][0]
+        assert "Japanese" in prompt
+        assert "use {output_language} and {text}" in prompt
+
 
 class TestTranslateArticleMeta:
     """Tests for the translate_article_meta function."""